@@ -1,4 +1,3 @@
-print("🚀 Mock Fusion API running on http://localhost:8000")
 import http.server
 import socketserver
 import json
@@ -27,7 +26,9 @@ class MockHandler(http.server.SimpleHTTPRequestHandler):
         self.send_header("Access-Control-Allow-Headers", "Content-Type")
         self.end_headers()
 
-PORT = 8000
-with socketserver.TCPServer(("", PORT), MockHandler) as httpd:
-    print(f"Mock API server running on port {PORT}")
-    httpd.serve_forever()
+if __name__ == "__main__":
+    print("🚀 Mock Fusion API running on http://localhost:8000")
+    PORT = 8000
+    with socketserver.TCPServer(("", PORT), MockHandler) as httpd:
+        print(f"Mock API server running on port {PORT}")
+        httpd.serve_forever()
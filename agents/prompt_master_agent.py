@@ -9,6 +9,7 @@ import time
 import logging
 import json
 import os
+import threading
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
@@ -22,6 +23,11 @@ class PromptMasterAgent:
         self.logger = logging.getLogger("PromptMasterAgent")
         self.memory_file = "memory/agent_memory.json"
         self.pattern_file = "memory/pattern_registry.json"
+        # run_sync may be called from several worker threads at once; the lock
+        # is reentrant so run_sync can hold it across its read-modify-write
+        self._memory_lock = threading.RLock()
+        # (mtime, index) for the flattened pattern registry, see _pattern_index
+        self._pattern_index_cache = (None, ())
         
         # Initialize memory and pattern files if they don't exist
         self._ensure_memory_files()
@@ -61,24 +67,24 @@ class PromptMasterAgent:
                     }
                 }, f)
     
-    async def _read_memory(self) -> Dict[str, Any]:
+    def _read_memory(self) -> Dict[str, Any]:
         """Read agent memory from JSON file"""
         try:
-            with open(self.memory_file, 'r') as f:
+            with self._memory_lock, open(self.memory_file, 'r') as f:
                 return json.load(f)
         except Exception as e:
             self.logger.error(f"Error reading memory: {e}")
             return {"prompt_master": []}
     
-    async def _write_memory(self, memory_data: Dict[str, Any]):
+    def _write_memory(self, memory_data: Dict[str, Any]):
         """Write agent memory to JSON file"""
         try:
-            with open(self.memory_file, 'w') as f:
+            with self._memory_lock, open(self.memory_file, 'w') as f:
                 json.dump(memory_data, f, indent=2)
         except Exception as e:
             self.logger.error(f"Error writing memory: {e}")
     
-    async def _read_patterns(self) -> Dict[str, Any]:
+    def _read_patterns(self) -> Dict[str, Any]:
         """Read pattern registry from JSON file"""
         try:
             with open(self.pattern_file, 'r') as f:
@@ -87,34 +93,53 @@ class PromptMasterAgent:
             self.logger.error(f"Error reading patterns: {e}")
             return {"patterns": {}}
     
-    async def _analyze_prompt_pattern(self, prompt: str) -> Tuple[str, float, List[str]]:
+    def _pattern_index(self) -> Tuple[Tuple[str, Tuple[str, ...], List[str]], ...]:
+        """
+        Pattern registry flattened to (name, keywords, suggested_agents) tuples
+        
+        Rebuilt only when the pattern file's mtime changes, so a request doesn't
+        re-read and re-parse the registry JSON before scoring
+        """
+        try:
+            mtime = os.stat(self.pattern_file).st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        cached_mtime, index = self._pattern_index_cache
+        if mtime is None or mtime != cached_mtime:
+            patterns = self._read_patterns()
+            index = tuple(
+                (pattern_name, tuple(pattern_data.get("keywords", [])), pattern_data.get("suggested_agents", []))
+                for pattern_name, pattern_data in patterns.get("patterns", {}).items()
+            )
+            if mtime is not None:
+                self._pattern_index_cache = (mtime, index)
+        return index
+    
+    def _analyze_prompt_pattern(self, prompt: str) -> Tuple[str, float, List[str]]:
         """Analyze prompt and return pattern type, confidence, and suggested agents"""
-        patterns = await self._read_patterns()
         prompt_lower = prompt.lower()
+        contains = prompt_lower.__contains__
         
         best_pattern = "general"
         best_confidence = 0.0
         suggested_agents = []
         
-        for pattern_name, pattern_data in patterns.get("patterns", {}).items():
-            keywords = pattern_data.get("keywords", [])
-            confidence = 0.0
-            
-            # Calculate confidence based on keyword matches
-            for keyword in keywords:
-                if keyword in prompt_lower:
-                    confidence += 0.2
+        for pattern_name, keywords, pattern_agents in self._pattern_index():
+            # Calculate confidence based on keyword matches; the substring
+            # checks run in C via map instead of a Python-level loop
+            confidence = sum(map(contains, keywords)) * 0.2
             
             if confidence > best_confidence:
                 best_confidence = confidence
                 best_pattern = pattern_name
-                suggested_agents = pattern_data.get("suggested_agents", [])
+                suggested_agents = list(pattern_agents)
         
         return best_pattern, min(best_confidence, 1.0), suggested_agents
     
-    async def _get_memory_insights(self, prompt: str) -> Dict[str, Any]:
+    def _get_memory_insights(self, prompt: str) -> Dict[str, Any]:
         """Get insights from past prompt-response pairs"""
-        memory = await self._read_memory()
+        memory = self._read_memory()
         prompt_memory = memory.get("prompt_master", [])
         
         insights = {
@@ -143,7 +168,7 @@ class PromptMasterAgent:
         
         return insights
     
-    async def _rewrite_prompt(self, prompt: str, pattern: str, insights: Dict[str, Any]) -> str:
+    def _rewrite_prompt(self, prompt: str, pattern: str, insights: Dict[str, Any]) -> str:
         """Rewrite prompt based on pattern and memory insights"""
         rewritten = prompt
         
@@ -175,18 +200,27 @@ class PromptMasterAgent:
         """
         Main async execution method for Prompt Master Agent
         """
+        return self.run_sync(prompt, context)
+    
+    def run_sync(self, prompt: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Synchronous execution path for Prompt Master Agent
+        
+        The analysis is pure CPU work plus small file reads/writes, so callers
+        that don't need a coroutine (e.g. threadpool endpoints) can call this directly
+        """
         start_time = time.time()
         self.logger.info("Prompt Master Agent starting analysis")
         
         try:
             # Analyze prompt pattern
-            pattern, confidence, suggested_agents = await self._analyze_prompt_pattern(prompt)
+            pattern, confidence, suggested_agents = self._analyze_prompt_pattern(prompt)
             
             # Get memory insights
-            insights = await self._get_memory_insights(prompt)
+            insights = self._get_memory_insights(prompt)
             
             # Rewrite prompt based on pattern and insights
-            rewritten_prompt = await self._rewrite_prompt(prompt, pattern, insights)
+            rewritten_prompt = self._rewrite_prompt(prompt, pattern, insights)
             
             # Determine if fallback is needed
             fallback_needed = confidence < 0.7
@@ -228,22 +262,23 @@ class PromptMasterAgent:
             execution_time = time.time() - start_time
             
             # Store in memory
-            memory_data = await self._read_memory()
-            memory_entry = {
-                "agent_name": "prompt_master",
-                "prompt": prompt,
-                "response": enhanced_output,
-                "confidence": confidence,
-                "fallback_flag": fallback_needed,
-                "pattern": pattern,
-                "suggested_agents": suggested_agents,
-                "timestamp": datetime.now().isoformat()
-            }
+            with self._memory_lock:
+                memory_data = self._read_memory()
+                memory_entry = {
+                    "agent_name": "prompt_master",
+                    "prompt": prompt,
+                    "response": enhanced_output,
+                    "confidence": confidence,
+                    "fallback_flag": fallback_needed,
+                    "pattern": pattern,
+                    "suggested_agents": suggested_agents,
+                    "timestamp": datetime.now().isoformat()
+                }
             
-            memory_data["prompt_master"] = memory_data.get("prompt_master", []) + [memory_entry]
-            # Keep only last 20 entries
-            memory_data["prompt_master"] = memory_data["prompt_master"][-20:]
-            await self._write_memory(memory_data)
+                memory_data["prompt_master"] = memory_data.get("prompt_master", []) + [memory_entry]
+                # Keep only last 20 entries
+                memory_data["prompt_master"] = memory_data["prompt_master"][-20:]
+                self._write_memory(memory_data)
             
             self.logger.info(f"Prompt Master Agent completed in {execution_time:.2f}s")
             
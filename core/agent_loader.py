@@ -5,11 +5,259 @@ Replaces static agent maps with manifest-driven dynamic loading
 """
 
 import json
+import functools
 import importlib
+import logging
 import os
-from typing import Dict, Any, Type, Optional
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Tuple, Type, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; large manifests are parsed whole
+    ijson = None
+
+logger = logging.getLogger("AgentLoader")
+
+
+# Parsed JSON keyed by path, tagged with the file's mtime when it was read
+_json_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _load_json(path: str) -> Dict[str, Any]:
+    """
+    Parse a JSON file, using orjson when it is installed.
+    
+    Results are cached until the file's mtime changes, so callers must
+    treat the returned dict as read-only.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    entry = _json_cache.get(path)
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
+    
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    
+    _json_cache[path] = (mtime, data)
+    return data
+
+
+# Manifests larger than this are streamed with ijson, when it is installed
+_STREAMING_MANIFEST_BYTES = 1024 * 1024
+
+
+def _should_stream(path: str) -> bool:
+    """Whether a manifest is large enough to stream instead of parsing whole"""
+    return ijson is not None and os.path.getsize(path) > _STREAMING_MANIFEST_BYTES
+
+
+def _read_manifest_section(path: str, prefix: str) -> Any:
+    """Stream a single top-level section out of a manifest with ijson"""
+    with open(path, 'rb') as f:
+        return next(ijson.items(f, prefix, use_float=True), {})
+
+
+def ensure_agents_on_path(bundle_path: str = "agents.zip") -> bool:
+    """
+    Put a zipped agents bundle at the front of sys.path, if one exists.
+    
+    zipimport then resolves every agent module from one open archive
+    instead of a separate file lookup per module. Must run before the
+    agents package is first imported to take effect.
+    
+    Args:
+        bundle_path: Archive built with `python -m zipfile -c agents.zip agents/`
+        
+    Returns:
+        True if the bundle is on sys.path
+    """
+    bundle = os.path.abspath(bundle_path)
+    if bundle in sys.path:
+        return True
+    if not os.path.isfile(bundle):
+        return False
+    
+    sys.path.insert(0, bundle)
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _snake_to_pascal(snake_str: str) -> str:
+    """Convert snake_case to PascalCase"""
+    return "".join(word.capitalize() for word in snake_str.split("_"))
+
+
+# Resolved (module_path, class_name) -> class, shared by every loader
+_resolved_classes: Dict[tuple, Type] = {}
+
+
+def cached_import(module_path: str, class_name: str) -> Type:
+    """
+    Import a module attribute, skipping the import machinery when possible.
+    
+    Args:
+        module_path: Dotted module path, e.g. "agents.vp_design_agent"
+        class_name: Attribute to fetch from the module
+        
+    Returns:
+        The resolved attribute (normally an agent class)
+    """
+    key = (module_path, class_name)
+    try:
+        return _resolved_classes[key]
+    except KeyError:
+        pass
+    
+    modules = sys.modules
+    module = modules.get(module_path)
+    spec = getattr(module, "__spec__", None)
+    if module is None or (spec is not None and getattr(spec, "_initializing", False)):
+        importlib.import_module(module_path)
+        module = modules[module_path]
+    
+    resolved = getattr(module, class_name)
+    _resolved_classes[key] = resolved
+    return resolved
+
+
+# Manifest agent instances keyed by (module_path, class_name), so the eager
+# loaders and the dispatcher's lazy mapping hand out the same objects
+_agent_instances: Dict[tuple, Any] = {}
+_agent_instances_lock = threading.Lock()
+
+
+def shared_agent(module_path: str, class_name: str) -> Any:
+    """
+    Return the process-wide instance of a manifest agent, constructing it on first use.
+    
+    Args:
+        module_path: Dotted module path of the agent
+        class_name: Agent class name within that module
+        
+    Returns:
+        The shared agent instance
+        
+    Raises:
+        ImportError, AttributeError: If the agent class can't be resolved
+    """
+    key = (module_path, class_name)
+    try:
+        return _agent_instances[key]
+    except KeyError:
+        pass
+    
+    agent_class = cached_import(module_path, class_name)
+    with _agent_instances_lock:
+        agent = _agent_instances.get(key)
+        if agent is None:
+            agent = _agent_instances[key] = agent_class()
+    return agent
+
+
+# Agent imports are dominated by file I/O and .pyc unmarshaling, which
+# release the GIL, so a small pool overlaps them well
+_IMPORT_WORKERS = 8
+
+
+def _import_agent_classes(specs: Iterable[Tuple[str, str, str]]) -> List[Tuple[str, Future]]:
+    """
+    Import agent classes concurrently.
+    
+    Args:
+        specs: (agent_name, module_path, class_name) tuples
+        
+    Returns:
+        (agent_name, future) pairs in manifest order; each future resolves
+        to the agent class or raises the import error for that agent alone
+    """
+    with ThreadPoolExecutor(max_workers=_IMPORT_WORKERS) as executor:
+        return [
+            (name, executor.submit(cached_import, module_path, class_name))
+            for name, module_path, class_name in specs
+        ]
+
+
+def _agent_spec(agent_name: str) -> Tuple[str, str]:
+    """Module path and class name for a manifest agent"""
+    return f"agents.{agent_name}_agent", _snake_to_pascal(agent_name) + "Agent"
+
+
+def _build_core_agents(agent_names: Iterable[str]) -> Dict[str, Any]:
+    """
+    Import and instantiate manifest agents.
+    
+    Args:
+        agent_names: Agent names from the manifest's "agents" section
+        
+    Returns:
+        Dictionary mapping agent names to agent instances; agents that
+        fail to import are logged and skipped
+    """
+    specs = [(name, *_agent_spec(name)) for name in agent_names]
+    agents = {}
+    
+    # Instantiate on this thread so agent __init__ side effects stay serial
+    for (agent_name, module_path, class_name), (_, future) in zip(specs, _import_agent_classes(specs)):
+        try:
+            future.result()
+            agents[agent_name] = shared_agent(module_path, class_name)
+            logger.debug("Loaded agent: %s", agent_name)
+        except (ImportError, AttributeError) as e:
+            logger.warning("Failed to load agent %s: %s", agent_name, e)
+    
+    return agents
+
+
+# Upper bound on threads used to construct plugin agents
+_PLUGIN_INIT_WORKERS = 32
+
+
+def _instantiate_plugin_agents(plugin_registry: Any) -> Dict[str, Any]:
+    """
+    Construct every registered plugin agent concurrently.
+    
+    Plugin constructors may do their own I/O (config reads, model warmup),
+    so they run in a thread pool. A failing plugin is logged and skipped.
+    
+    Args:
+        plugin_registry: Registry holding the discovered plugin agent classes
+        
+    Returns:
+        Dictionary mapping plugin agent names to instances
+    """
+    agent_names = plugin_registry.list_agents()
+    if not agent_names:
+        return {}
+    
+    agents = {}
+    with ThreadPoolExecutor(max_workers=min(_PLUGIN_INIT_WORKERS, len(agent_names))) as executor:
+        futures = [
+            (agent_name, executor.submit(plugin_registry.get_agent(agent_name)))
+            for agent_name in agent_names
+        ]
+    
+    for agent_name, future in futures:
+        try:
+            agents[agent_name] = future.result()
+            logger.debug("Loaded plugin agent: %s", agent_name)
+        except Exception as e:
+            logger.warning("Failed to instantiate plugin agent %s: %s", agent_name, e)
+    
+    return agents
+
 
 class AgentLoader:
     """Dynamic agent loader that reads from agent_manifest.json"""
@@ -19,6 +267,9 @@ class AgentLoader:
         self.plugins_dir = Path(plugins_dir)
         self.loaded_agents = {}
         self.manifest_data = {}
+        self._streamed = False
+        self._agents_cfg: Dict[str, Any] = {}
+        self._sys_caps: Optional[Dict[str, Any]] = {}
         
     def load_agents(self) -> Dict[str, Any]:
         """
@@ -45,33 +296,22 @@ class AgentLoader:
         agents = {}
         
         try:
-            with open(self.manifest_path, 'r') as f:
-                self.manifest_data = json.load(f)
+            # Large manifests only materialize the "agents" section; other
+            # sections are streamed on demand
+            self._streamed = _should_stream(self.manifest_path)
+            if self._streamed:
+                self.manifest_data = {"agents": _read_manifest_section(self.manifest_path, "agents")}
+            else:
+                self.manifest_data = _load_json(self.manifest_path)
         except FileNotFoundError:
-            print(f"⚠️ Warning: Manifest file {self.manifest_path} not found")
+            logger.warning("Manifest file %s not found", self.manifest_path)
             return agents
         
-        manifest_agents = self.manifest_data.get("agents", {})
-        
-        for agent_name, agent_config in manifest_agents.items():
-            try:
-                # Convert agent name to module and class name
-                module_name = f"agents.{agent_name}_agent"
-                class_name = self._snake_to_pascal(agent_name) + "Agent"
-                
-                # Import and instantiate the agent
-                module = importlib.import_module(module_name)
-                agent_class = getattr(module, class_name)
-                agent_instance = agent_class()
-                
-                agents[agent_name] = agent_instance
-                print(f"✅ Loaded agent: {agent_name}")
-                
-            except (ImportError, AttributeError) as e:
-                print(f"⚠️ Failed to load agent {agent_name}: {e}")
-                continue
+        # Resolve manifest sections once; None defers a streamed section
+        self._agents_cfg = self.manifest_data.get("agents", {})
+        self._sys_caps = None if self._streamed else self.manifest_data.get("system_capabilities", {})
         
-        return agents
+        return _build_core_agents(self._agents_cfg)
     
     def _load_plugin_agents(self) -> Dict[str, Any]:
         """Load agents from plugins directory"""
@@ -79,47 +319,36 @@ class AgentLoader:
         
         agents = {}
         
-        if not self.plugins_dir.exists():
-            print(f"🔌 Creating plugins directory: {self.plugins_dir}")
-            self.plugins_dir.mkdir(exist_ok=True)
-            return agents
-        
-        # Discover and register plugins
-        discovery_results = plugin_registry.discover_plugins()
+        # Discover and register plugins; discovery tolerates a missing
+        # directory, so no existence check is needed here
+        discovery_results = plugin_registry.discover_plugins(self.plugins_dir)
         
         # Get registered plugin agents
-        for agent_name in plugin_registry.list_agents():
-            try:
-                agent_class = plugin_registry.get_agent(agent_name)
-                agent_instance = agent_class()
-                agents[agent_name] = agent_instance
-                print(f"🔌 Loaded plugin agent: {agent_name}")
-            except Exception as e:
-                print(f"⚠️ Failed to instantiate plugin agent {agent_name}: {e}")
+        agents.update(_instantiate_plugin_agents(plugin_registry))
         
         if discovery_results["agents_found"] > 0:
-            print(f"🔌 Plugin discovery summary: {discovery_results['agents_found']} agents, {discovery_results['tools_found']} tools")
+            logger.info("Plugin discovery summary: %d agents, %d tools", discovery_results["agents_found"], discovery_results["tools_found"])
         
         return agents
     
-    def _snake_to_pascal(self, snake_str: str) -> str:
-        """Convert snake_case to PascalCase"""
-        return "".join(word.capitalize() for word in snake_str.split("_"))
-    
     def get_agent_config(self, agent_name: str) -> Optional[Dict[str, Any]]:
         """Get configuration for a specific agent"""
-        return self.manifest_data.get("agents", {}).get(agent_name)
+        return self._agents_cfg.get(agent_name)
     
     def get_system_capabilities(self) -> Dict[str, Any]:
         """Get system capabilities from manifest"""
-        return self.manifest_data.get("system_capabilities", {})
+        if self._sys_caps is None:
+            self._sys_caps = _read_manifest_section(self.manifest_path, "system_capabilities")
+            self.manifest_data["system_capabilities"] = self._sys_caps
+        return self._sys_caps
     
     def list_available_agents(self) -> Dict[str, Any]:
         """List all available agents with their metadata"""
         agents_info = {}
+        agents_cfg = self._agents_cfg
         
         for agent_name, agent_instance in self.loaded_agents.items():
-            config = self.get_agent_config(agent_name) or {}
+            config = agents_cfg.get(agent_name) or {}
             
             agents_info[agent_name] = {
                 "role": config.get("role", "Unknown"),
@@ -134,6 +363,9 @@ class AgentLoader:
         return agents_info
 
 
+# Prefer a deployed agents.zip over the source tree, when one is shipped
+ensure_agents_on_path()
+
 # Global instance for easy access
 agent_loader = AgentLoader()
 
@@ -142,32 +374,56 @@ def load_agents(manifest_path: str = "agent_manifest.json") -> Dict[str, Any]:
     """
     Load agents from manifest file.
     
+    Agents are loaded once per process and manifest version: the result is
+    reused until the manifest's mtime changes, and each call returns a fresh
+    dict sharing the same agent instances.
+    
     Args:
         manifest_path: Path to agent manifest file
         
     Returns:
         Dictionary mapping agent names to agent instances
     """
+    return dict(_load_agents_cached(manifest_path, _manifest_mtime(manifest_path)))
+
+def _manifest_mtime(manifest_path: str) -> Optional[int]:
+    """Manifest mtime, part of the memoization key so edits are picked up"""
     try:
-        with open(manifest_path, 'r') as f:
-            data = json.load(f)
-        
-        agents = {}
-        for name in data["agents"]:
-            try:
-                module = importlib.import_module(f"agents.{name}_agent")
-                cls_name = "".join([w.title() for w in name.split("_")]) + "Agent"
-                cls = getattr(module, cls_name)
-                agents[name] = cls()
-                print(f"✅ Loaded agent: {name}")
-            except (ImportError, AttributeError) as e:
-                print(f"⚠️ Failed to load agent {name}: {e}")
-                continue
+        return os.stat(manifest_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+# Keyed on the manifest mtime, so only a few stale versions are ever worth keeping
+_MANIFEST_VERSIONS_CACHED = 8
+
+@functools.lru_cache(maxsize=_MANIFEST_VERSIONS_CACHED)
+def _load_agents_cached(manifest_path: str, manifest_mtime: Optional[int]) -> Dict[str, Any]:
+    """Load core agents from the manifest (memoized per mtime, do not mutate the result)"""
+    try:
+        data = _load_json(manifest_path)
+    except FileNotFoundError:
+        logger.warning("Manifest file %s not found", manifest_path)
+        return {}
+    
+    return _build_core_agents(data["agents"])
+
+def load_agent_specs(manifest_path: str = "agent_manifest.json") -> Dict[str, Tuple[str, str]]:
+    """
+    Resolve manifest agents to import locations without importing them.
+    
+    Args:
+        manifest_path: Path to agent manifest file
         
-        return agents
+    Returns:
+        Dictionary mapping agent names to (module_path, class_name) tuples
+    """
+    try:
+        data = _load_json(manifest_path)
     except FileNotFoundError:
-        print(f"⚠️ Warning: Manifest file {manifest_path} not found")
+        logger.warning("Manifest file %s not found", manifest_path)
         return {}
+    
+    return {name: _agent_spec(name) for name in data["agents"]}
 
 def load_plugins(plugins_dir: str = "plugins") -> Dict[str, Any]:
     """
@@ -179,30 +435,18 @@ def load_plugins(plugins_dir: str = "plugins") -> Dict[str, Any]:
     Returns:
         Dictionary mapping plugin agent names to instances
     """
-    import os
     from fusion_plugin_registry import plugin_registry
     
     plugin_agents = {}
     
-    if not os.path.exists(plugins_dir):
-        os.makedirs(plugins_dir, exist_ok=True)
-        return plugin_agents
-    
-    # Discover and register plugins
-    discovery_results = plugin_registry.discover_plugins()
+    # Discover and register plugins; discovery tolerates a missing directory
+    discovery_results = plugin_registry.discover_plugins(plugins_dir)
     
     # Get registered plugin agents
-    for agent_name in plugin_registry.list_agents():
-        try:
-            agent_class = plugin_registry.get_agent(agent_name)
-            agent_instance = agent_class()
-            plugin_agents[agent_name] = agent_instance
-            print(f"🔌 Loaded plugin agent: {agent_name}")
-        except Exception as e:
-            print(f"⚠️ Failed to instantiate plugin agent {agent_name}: {e}")
+    plugin_agents.update(_instantiate_plugin_agents(plugin_registry))
     
     if discovery_results["agents_found"] > 0:
-        print(f"🔌 Plugin discovery: {discovery_results['agents_found']} agents, {discovery_results['tools_found']} tools")
+        logger.info("Plugin discovery: %d agents, %d tools", discovery_results["agents_found"], discovery_results["tools_found"])
     
     return plugin_agents
 
@@ -210,6 +454,10 @@ def load_all_agents(manifest_path: str = "agent_manifest.json", plugins_dir: str
     """
     Load both core agents and plugins.
     
+    Like load_agents(), the result is cached per (manifest_path, plugins_dir)
+    until the manifest's mtime changes, and each call returns a fresh dict
+    sharing the same agent instances.
+    
     Args:
         manifest_path: Path to agent manifest file
         plugins_dir: Directory containing plugin agents
@@ -217,8 +465,13 @@ def load_all_agents(manifest_path: str = "agent_manifest.json", plugins_dir: str
     Returns:
         Dictionary mapping all agent names to agent instances
     """
+    return dict(_load_all_agents_cached(manifest_path, plugins_dir, _manifest_mtime(manifest_path)))
+
+@functools.lru_cache(maxsize=_MANIFEST_VERSIONS_CACHED)
+def _load_all_agents_cached(manifest_path: str, plugins_dir: str, manifest_mtime: Optional[int]) -> Dict[str, Any]:
+    """Load core and plugin agents (memoized per manifest mtime, do not mutate the result)"""
     # Load core agents
-    agents = load_agents(manifest_path)
+    agents = dict(_load_agents_cached(manifest_path, manifest_mtime))
     
     # Load plugin agents
     plugin_agents = load_plugins(plugins_dir)
@@ -228,9 +481,17 @@ def load_all_agents(manifest_path: str = "agent_manifest.json", plugins_dir: str
     
     return agents
 
+def clear_agent_cache() -> None:
+    """Drop cached agent instances so the next load re-reads the manifest"""
+    _load_agents_cached.cache_clear()
+    _load_all_agents_cached.cache_clear()
+    with _agent_instances_lock:
+        _agent_instances.clear()
+
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
     print("🚀 Testing Dynamic Agent Loader")
     
     # Load all agents
@@ -5,9 +5,101 @@ Proper agent dispatch system replacing direct agent calls
 """
 
 import asyncio
+import inspect
 import logging
-from typing import Dict, Any, Optional
-from core.agent_loader import load_agents
+import types
+from collections.abc import Mapping
+from typing import Dict, Any, Awaitable, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+from core.agent_loader import cached_import, load_agent_specs, shared_agent
+
+logger = logging.getLogger("Dispatcher")
+
+# Shared read-only context for dispatches that don't pass one
+_EMPTY_CTX = types.MappingProxyType({})
+
+class _LazyAgents(Mapping):
+    """
+    Read-only agent mapping that imports and constructs each agent on first access
+    
+    Instances come from core.agent_loader.shared_agent, so they are the same
+    objects load_agents() returns. An agent whose class can't be imported is
+    logged and dropped the first time it is looked up, so it never shows up
+    as available.
+    """
+    
+    def __init__(self, specs: Dict[str, Tuple[str, str]]):
+        self._specs = dict(specs)
+        
+    def _resolve(self, agent_name: str) -> Optional[Tuple[str, str]]:
+        """Spec for agent_name if its class imports, forgetting the agent otherwise"""
+        spec = self._specs.get(agent_name)
+        if spec is None:
+            return None
+        try:
+            cached_import(*spec)
+        except (ImportError, AttributeError) as e:
+            logger.warning("Agent %s is unavailable: %s", agent_name, e)
+            self._specs.pop(agent_name, None)
+            return None
+        return spec
+        
+    def __getitem__(self, agent_name: str) -> Any:
+        spec = self._resolve(agent_name)
+        if spec is None:
+            raise KeyError(agent_name)
+        return shared_agent(*spec)
+        
+    def __contains__(self, agent_name: object) -> bool:
+        return isinstance(agent_name, str) and self._resolve(agent_name) is not None
+        
+    def __iter__(self) -> Iterator[str]:
+        return (agent_name for agent_name in list(self._specs) if self._resolve(agent_name) is not None)
+        
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+        
+    def class_name(self, agent_name: str) -> str:
+        """Agent class name, without constructing the agent"""
+        spec = self._resolve(agent_name)
+        if spec is None:
+            raise KeyError(agent_name)
+        return spec[1]
+
+def _make_adapter(agent: Any) -> Callable[[str, Dict[str, Any]], Awaitable[Any]]:
+    """
+    Bind an agent's entry point once so dispatch can skip per-call hasattr probes
+    
+    Prefers run_async, then run; agents with neither are called directly
+    with the input text. Coroutine functions are awaited on the loop, while
+    synchronous entry points run in the default executor so they can't
+    block other dispatches.
+    """
+    if hasattr(agent, 'run_async'):
+        entry_point = agent.run_async
+    elif hasattr(agent, 'run'):
+        entry_point = agent.run
+    else:
+        entry_point = None
+    
+    if entry_point is None:
+        async def call_directly(input_text: str, context: Dict[str, Any]) -> Any:
+            loop = asyncio.get_running_loop()
+            return str(await loop.run_in_executor(None, agent, input_text))
+        
+        return call_directly
+    
+    if inspect.iscoroutinefunction(entry_point):
+        return entry_point
+    
+    async def run_in_executor(input_text: str, context: Dict[str, Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, entry_point, input_text, context)
+        # Sync wrappers around async code hand back an awaitable
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    
+    return run_in_executor
 
 class Dispatcher:
     """
@@ -15,8 +107,9 @@ class Dispatcher:
     """
     
     def __init__(self):
-        self.logger = logging.getLogger("Dispatcher")
-        self.agents = load_agents()
+        self.logger = logger
+        self.agents = _LazyAgents(load_agent_specs())
+        self._adapters: Dict[str, Callable[[str, Dict[str, Any]], Awaitable[Any]]] = {}
         
     async def dispatch(self, agent_name: str, input_text: str, context: Dict[str, Any] = None) -> str:
         """
@@ -25,44 +118,57 @@ class Dispatcher:
         Args:
             agent_name: Name of the agent to dispatch to
             input_text: Input text/prompt
-            context: Optional context dictionary
+            context: Optional context dictionary; agents must treat it as
+                read-only since calls without one share a single empty mapping
             
         Returns:
             String output from the agent
         """
-        if agent_name not in self.agents:
-            raise ValueError(f"Agent '{agent_name}' not found. Available: {list(self.agents.keys())}")
-            
-        agent = self.agents[agent_name]
-        
         try:
-            # Try async run method first
-            if hasattr(agent, 'run_async'):
-                result = await agent.run_async(input_text, context or {})
-                # Handle both dict and string responses
-                if isinstance(result, dict):
-                    return result.get('output', result.get('enhanced_output', str(result)))
-                return str(result)
+            # Agents whose class fails to import are dropped from the mapping
+            # here, so they surface as not found
+            if agent_name not in self.agents:
+                raise ValueError(f"Agent '{agent_name}' not found. Available: {list(self.agents.keys())}")
                 
-            # Try regular run method
-            elif hasattr(agent, 'run'):
-                result = await agent.run(input_text, context or {})
-                if isinstance(result, dict):
-                    return result.get('output', result.get('enhanced_output', str(result)))
-                return str(result)
-                
-            # Fallback to calling agent directly
-            else:
-                result = agent(input_text)
-                return str(result)
+            adapter = self._adapters.get(agent_name)
+            if adapter is None:
+                adapter = self._adapters[agent_name] = _make_adapter(self.agents[agent_name])
+            
+            result = await adapter(input_text, context if context is not None else _EMPTY_CTX)
+            
+            # Handle both dict and string responses
+            if isinstance(result, dict):
+                if 'output' in result:
+                    return result['output']
+                if 'enhanced_output' in result:
+                    return result['enhanced_output']
+            return str(result)
                 
         except Exception as e:
             self.logger.error(f"Error dispatching to {agent_name}: {e}")
             raise
             
+    async def dispatch_many(
+        self, requests: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]]
+    ) -> List[Union[str, BaseException]]:
+        """
+        Dispatch several requests concurrently
+        
+        Args:
+            requests: (agent_name, input_text, context) tuples
+            
+        Returns:
+            Outputs in request order; a failed request yields its exception
+            in place of the output instead of cancelling the others
+        """
+        return await asyncio.gather(
+            *(self.dispatch(agent_name, input_text, context) for agent_name, input_text, context in requests),
+            return_exceptions=True
+        )
+            
     def list_agents(self) -> Dict[str, str]:
         """List all available agents with their types"""
-        return {name: type(agent).__name__ for name, agent in self.agents.items()}
+        return {name: self.agents.class_name(name) for name in self.agents}
 
 # Global dispatcher instance
 dispatcher = Dispatcher()
\ No newline at end of file
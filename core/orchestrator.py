@@ -5,10 +5,52 @@ Handles prompt rewriting and agent selection
 """
 
 import asyncio
+import functools
 import logging
+import re
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 from agents.prompt_master_agent import PromptMasterAgent
 
+# Agent routing map based on prompt patterns, shared read-only by all instances
+AGENT_ROUTING = MappingProxyType({
+    "design": ("vp_design", "creative_director", "principal_designer"),
+    "strategy": ("strategy_pilot", "vp_of_product", "market_analyst"),
+    "technical": ("design_technologist", "component_librarian"),
+    "content": ("content_designer", "deck_narrator"),
+    "evaluation": ("evaluator", "feedback_amplifier"),
+    "general": ("evaluator", "vp_design"),
+})
+
+# Keyword routing table, checked in priority order by select_agent
+ROUTING_KEYWORDS = MappingProxyType({
+    "vp_design": ("design", "ui", "ux", "interface", "visual"),
+    "strategy_pilot": ("strategy", "roadmap", "business", "plan"),
+    "design_technologist": ("code", "technical", "implement", "development"),
+    "content_designer": ("content", "copy", "text", "narrative"),
+    "evaluator": ("evaluate", "analyze", "review", "critique"),
+})
+
+# One case-insensitive alternation per agent, scanned in C by the
+# regex engine; order preserves the keyword priority
+_ROUTES = tuple(
+    (agent, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+    for agent, keywords in ROUTING_KEYWORDS.items()
+)
+
+# Longer prompts are routed without caching to bound cache key memory
+_MAX_CACHED_PROMPT_LENGTH = 256
+
+def _select_agent_impl(prompt: str) -> str:
+    """Return the first agent whose keywords appear in the prompt"""
+    for agent, pattern in _ROUTES:
+        if pattern.search(prompt):
+            return agent
+    
+    return "evaluator"  # Default fallback
+
+_select_agent_cached = functools.lru_cache(maxsize=1024)(_select_agent_impl)
+
 class Orchestrator:
     """
     Core orchestrator for prompt rewriting and agent selection
@@ -17,16 +59,7 @@ class Orchestrator:
     def __init__(self):
         self.logger = logging.getLogger("Orchestrator")
         self.prompt_master = PromptMasterAgent()
-        
-        # Agent routing map based on prompt patterns
-        self.agent_routing = {
-            "design": ["vp_design", "creative_director", "principal_designer"],
-            "strategy": ["strategy_pilot", "vp_of_product", "market_analyst"],
-            "technical": ["design_technologist", "component_librarian"],
-            "content": ["content_designer", "deck_narrator"],
-            "evaluation": ["evaluator", "feedback_amplifier"],
-            "general": ["evaluator", "vp_design"]
-        }
+        self.agent_routing = AGENT_ROUTING
         
     async def rewrite(self, prompt: str) -> str:
         """
@@ -43,14 +76,16 @@ class Orchestrator:
             
             if isinstance(result, dict):
                 # Check for rewritten prompt in shared state
-                shared_state = result.get("shared_state", {})
-                rewritten = shared_state.get("rewritten_prompt")
+                shared_state = result.get("shared_state")
+                rewritten = shared_state.get("rewritten_prompt") if shared_state else None
                 
                 if rewritten:
                     return rewritten
                     
-                # Fallback to output or enhanced_output
-                return result.get("enhanced_output", result.get("output", prompt))
+                # Fallback to enhanced_output, then output, only looking up what's needed
+                if "enhanced_output" in result:
+                    return result["enhanced_output"]
+                return result.get("output", prompt)
             
             return str(result)
             
@@ -68,21 +103,10 @@ class Orchestrator:
         Returns:
             Selected agent name
         """
-        prompt_lower = prompt.lower()
-        
-        # Simple keyword-based routing
-        if any(word in prompt_lower for word in ["design", "ui", "ux", "interface", "visual"]):
-            return "vp_design"
-        elif any(word in prompt_lower for word in ["strategy", "roadmap", "business", "plan"]):
-            return "strategy_pilot"
-        elif any(word in prompt_lower for word in ["code", "technical", "implement", "development"]):
-            return "design_technologist"
-        elif any(word in prompt_lower for word in ["content", "copy", "text", "narrative"]):
-            return "content_designer"
-        elif any(word in prompt_lower for word in ["evaluate", "analyze", "review", "critique"]):
-            return "evaluator"
-        else:
-            return "evaluator"  # Default fallback
+        # Routing is a pure function of the prompt, so repeats hit the cache
+        if len(prompt) <= _MAX_CACHED_PROMPT_LENGTH:
+            return _select_agent_cached(prompt)
+        return _select_agent_impl(prompt)
 
 # Global orchestrator instance
 orchestrator = Orchestrator()
\ No newline at end of file
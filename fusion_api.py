@@ -1,23 +1,171 @@
 # fusion_api.py
 
-from fastapi import FastAPI, Request, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Literal, Tuple
 import asyncio
+import hashlib
 import json
+import logging
+import logging.handlers
 import os
-import httpx
+import queue
+import tempfile
+import time
+import aiohttp
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
 # Import dynamic agent loader
 from core.agent_loader import load_agents, load_plugins
+from core.ttl_cache import TTLCache
 
 # Import Fusion core components
 from fusion_core.memory.agent_memory import AgentMemory
 from fusion_core.telemetry.agent_telemetry import AgentTelemetryLogger
-from fusion_core.orchestration.multi_agent_orchestrator import MultiAgentOrchestrator
+from fusion_core.orchestration.multi_agent_orchestrator import MultiAgentOrchestrator, AgentCapacityError
+
+logger = logging.getLogger("FusionAPI")
+
+# Prompt Orchestrator Configuration
+PROMPT_ORCHESTRATOR_URL = "http://localhost:8001"
+
+# Cap on agents executing at once across all /run_parallel requests
+MAX_AGENT_CONCURRENCY = int(os.environ.get("FUSION_MAX_AGENT_CONC", 32))
+MAX_AGENT_WAITING = 256
+AGENT_SLOT_TIMEOUT = float(os.environ.get("FUSION_AGENT_SLOT_TIMEOUT", 10))
+DEFAULT_EXECUTOR_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Agent recommendations from /route depend only on the prompt and the pattern
+# registry, so repeats are served from a short-lived cache instead of another
+# round-trip. /rewrite is not cached: the orchestrator records every call in
+# its memory and derives the rewrite from that memory
+MAX_ENTRIES = 5000
+CACHE_TTL_SECONDS = 120
+_route_cache = TTLCache(maxsize=MAX_ENTRIES, ttl=CACHE_TTL_SECONDS)
+
+def _cache_key(prompt: str) -> bytes:
+    """Digest of the prompt, used as the routing cache key"""
+    return hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+
+# Telemetry events are queued by request handlers and recorded in batches
+TELEMETRY_QUEUE_SIZE = 10_000
+TELEMETRY_BATCH_SIZE = 100
+TELEMETRY_FLUSH_INTERVAL = 0.05
+
+async def _telemetry_flusher(telemetry_queue: asyncio.Queue):
+    """Background task that flushes queued telemetry events in batches"""
+    while True:
+        batch = [await telemetry_queue.get()]
+        while len(batch) < TELEMETRY_BATCH_SIZE and not telemetry_queue.empty():
+            batch.append(telemetry_queue.get_nowait())
+        # A bad batch must not kill the task, or the queue would fill up for good
+        try:
+            telemetry_logger.log_batch(batch)
+        except Exception:
+            logger.exception("Failed to record %d telemetry events", len(batch))
+        await asyncio.sleep(TELEMETRY_FLUSH_INTERVAL)
+
+def queue_telemetry(**event):
+    """Queue a telemetry event without blocking; the event is dropped if the queue is full"""
+    event["logged_at"] = time.time()
+    try:
+        app.state.telemetry_q.put_nowait(event)
+    except asyncio.QueueFull:
+        app.state.telemetry_dropped += 1
+        logger.warning("Telemetry queue full, dropped event for %s", event.get("agent"))
+
+def _start_log_listener() -> Optional[Tuple[logging.handlers.QueueListener, logging.Handler]]:
+    """
+    Route API log records through a queue so formatting and I/O happen off the request path
+    
+    Records still propagate, so an application-level logging config keeps
+    receiving them. When the root logger already has handlers, none are added
+    here, so records aren't written twice.
+    
+    Returns:
+        (listener, queue_handler) to stop on shutdown, or None if nothing was started
+    """
+    logger.setLevel(os.environ.get("FUSION_LOG_LEVEL", "INFO").upper())
+    if logging.getLogger().handlers:
+        return None
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s"))
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    listener.start()
+    return listener, queue_handler
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share one pooled HTTP session with the prompt orchestrator, run the telemetry flusher and start logging"""
+    app.state.aio = aiohttp.ClientSession(
+        base_url=PROMPT_ORCHESTRATOR_URL,
+        connector=aiohttp.TCPConnector(limit=1000, limit_per_host=200, keepalive_timeout=75),
+        timeout=aiohttp.ClientTimeout(total=30)
+    )
+    # Sync agents and memory writes run on the default executor
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=DEFAULT_EXECUTOR_WORKERS)
+    )
+    app.state.telemetry_q = asyncio.Queue(maxsize=TELEMETRY_QUEUE_SIZE)
+    app.state.telemetry_dropped = 0
+    flusher = asyncio.create_task(_telemetry_flusher(app.state.telemetry_q))
+    log_listener = _start_log_listener()
+    try:
+        yield
+    finally:
+        flusher.cancel()
+        try:
+            await flusher
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("Telemetry flusher stopped unexpectedly")
+        # Record anything still queued before shutting down
+        pending = []
+        while not app.state.telemetry_q.empty():
+            pending.append(app.state.telemetry_q.get_nowait())
+        if pending:
+            try:
+                telemetry_logger.log_batch(pending)
+            except Exception:
+                logger.exception("Failed to record %d telemetry events at shutdown", len(pending))
+        await app.state.aio.close()
+        if log_listener is not None:
+            listener, queue_handler = log_listener
+            logger.removeHandler(queue_handler)
+            listener.stop()
 
-app = FastAPI(title="Fusion v15 API", version="15.0.0")
+def _dumps(data: Any) -> bytes:
+    """Serialize data to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+class FusionJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when available"""
+    
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
+app = FastAPI(
+    title="Fusion v15 API",
+    version="15.0.0",
+    lifespan=lifespan,
+    default_response_class=FusionJSONResponse
+)
 
 # Add CORS middleware
 app.add_middleware(
@@ -35,6 +183,7 @@ class RunRequest(BaseModel):
     use_memory: bool = True
     use_telemetry: bool = True
     use_prompt_orchestrator: bool = True
+    skip_rewrite: bool = False
 
 class PromptRequest(BaseModel):
     input: str
@@ -42,11 +191,13 @@ class PromptRequest(BaseModel):
     use_memory: bool = True
     use_telemetry: bool = True
     use_prompt_orchestrator: bool = True
+    skip_rewrite: bool = False
 
 class ParallelRunRequest(BaseModel):
     agents: List[str]
     input: str
     use_evaluator: bool = True
+    dispatch_strategy: Literal["batch", "bounded", "pipeline"] = "batch"
 
 class AgentStatus(BaseModel):
     agent: str
@@ -77,12 +228,18 @@ orchestrator = MultiAgentOrchestrator(
     agents=agent_map,
     evaluator_agent=agent_map.get("evaluator"),
     telemetry_logger=telemetry_logger,
-    memory_manager=memory_manager
+    memory_manager=memory_manager,
+    max_concurrency=MAX_AGENT_CONCURRENCY,
+    max_waiting=MAX_AGENT_WAITING,
+    slot_timeout=AGENT_SLOT_TIMEOUT
 )
 
 # Load agent manifest
 def load_agent_manifest():
     try:
+        if orjson is not None:
+            with open("agent_manifest.json", "rb") as f:
+                return orjson.loads(f.read())
         with open("agent_manifest.json", "r") as f:
             return json.load(f)
     except FileNotFoundError:
@@ -90,120 +247,184 @@ def load_agent_manifest():
 
 agent_manifest = load_agent_manifest()
 
-# Prompt Orchestrator Configuration
-PROMPT_ORCHESTRATOR_URL = "http://localhost:8001"
+def _manifest_entry(info: Dict[str, Any]) -> MappingProxyType:
+    """Flatten a manifest agent entry to the fields the API reports"""
+    return MappingProxyType({
+        "role": info.get("role", "Unknown"),
+        "capabilities": tuple(info.get("capabilities", ())),
+        "confidence_threshold": info.get("confidence_threshold", 0.8),
+        "memory_enabled": info.get("memory_enabled", True),
+        "telemetry_enabled": info.get("telemetry_enabled", True)
+    })
+
+# Per-agent manifest fields resolved once at startup, keyed by agent name
+_AGENT_MANIFEST_BY_NAME = {
+    name: _manifest_entry(info) for name, info in agent_manifest.get("agents", {}).items()
+}
+_EMPTY_MANIFEST = _manifest_entry({})
+
+# The agent roster only changes on restart or an explicit reload, so the
+# /agents body is serialized once and served as-is
+AGENT_LIST_CACHE_TTL = 60
+
+def _build_agents_listing() -> bytes:
+    """Serialize the /agents response body for the current agent map"""
+    agents_info = {}
+    
+    for agent_name, agent in agent_map.items():
+        agents_info[agent_name] = {
+            **_AGENT_MANIFEST_BY_NAME.get(agent_name, _EMPTY_MANIFEST),
+            "type": type(agent).__name__,
+            "available": True
+        }
+    
+    return _dumps({
+        "agents": agents_info,
+        "total_agents": len(agent_map),
+        "system_capabilities": agent_manifest.get("system_capabilities", {})
+    })
+
+def _refresh_agents_listing():
+    """Rebuild the cached /agents body and its ETag"""
+    global _AGENTS_CACHED_JSON, _AGENTS_ETAG
+    _AGENTS_CACHED_JSON = _build_agents_listing()
+    _AGENTS_ETAG = f'"{hashlib.blake2b(_AGENTS_CACHED_JSON, digest_size=8).hexdigest()}"'
+
+_refresh_agents_listing()
 
 async def call_prompt_orchestrator(prompt: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
     """Call the prompt orchestrator service for prompt rewriting and analysis"""
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{PROMPT_ORCHESTRATOR_URL}/rewrite",
-                json={
-                    "prompt": prompt,
-                    "context": context or {},
-                    "use_memory": True,
-                    "use_fallback": True
-                }
-            )
-            
-            if response.status_code == 200:
-                return response.json()
+        async with app.state.aio.post(
+            "/rewrite",
+            json={
+                "prompt": prompt,
+                "context": context or {},
+                "use_memory": True,
+                "use_fallback": True
+            }
+        ) as response:
+            if response.status == 200:
+                return await response.json()
             else:
-                print(f"⚠️ Prompt orchestrator failed: {response.status_code}")
+                logger.warning("Prompt orchestrator failed: %s", response.status)
                 return {"original_prompt": prompt, "rewritten_prompt": prompt, "confidence": 0.5}
                 
     except Exception as e:
-        print(f"⚠️ Prompt orchestrator error: {e}")
+        logger.warning("Prompt orchestrator error: %s", e)
         return {"original_prompt": prompt, "rewritten_prompt": prompt, "confidence": 0.5}
 
 async def get_agent_recommendation(prompt: str) -> Dict[str, Any]:
     """Get agent routing recommendation from prompt orchestrator"""
+    key = _cache_key(prompt)
+    cached = _route_cache.get(key)
+    if cached is not None:
+        return cached
+    
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{PROMPT_ORCHESTRATOR_URL}/route",
-                json={
-                    "prompt": prompt,
-                    "confidence_threshold": 0.7
-                }
-            )
-            
-            if response.status_code == 200:
-                return response.json()
+        async with app.state.aio.post(
+            "/route",
+            json={
+                "prompt": prompt,
+                "confidence_threshold": 0.7
+            },
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            if response.status == 200:
+                result = await response.json()
+                _route_cache[key] = result
+                return result
             else:
                 return {"recommended_agent": "evaluator", "confidence": 0.5}
                 
     except Exception as e:
-        print(f"⚠️ Agent routing error: {e}")
+        logger.warning("Agent routing error: %s", e)
         return {"recommended_agent": "evaluator", "confidence": 0.5}
 
+# The root payload never changes, so it is encoded once at import
+_ROOT_RESPONSE = _dumps({
+    "message": "Fusion v15 API",
+    "version": "15.0.0",
+    "endpoints": [
+        "/prompt - Universal prompt handler with auto-agent selection",
+        "/run - Run single agent",
+        "/run_parallel - Run multiple agents", 
+        "/agents - List available agents",
+        "/status - System status",
+        "/memory/{agent} - Get agent memory",
+        "/telemetry - Get telemetry data"
+    ]
+})
+
 @app.get("/")
 async def root():
     """Root endpoint with API information"""
-    return {
-        "message": "Fusion v15 API",
-        "version": "15.0.0",
-        "endpoints": [
-            "/prompt - Universal prompt handler with auto-agent selection",
-            "/run - Run single agent",
-            "/run_parallel - Run multiple agents", 
-            "/agents - List available agents",
-            "/status - System status",
-            "/memory/{agent} - Get agent memory",
-            "/telemetry - Get telemetry data"
-        ]
-    }
+    return Response(content=_ROOT_RESPONSE, media_type="application/json")
 
 @app.post("/run")
 async def run_agent(req: RunRequest):
     """Run a single agent with optional prompt orchestration"""
-    if req.agent not in agent_map:
-        raise HTTPException(status_code=404, detail=f"Agent '{req.agent}' not found")
+    return await _run_agent_impl(
+        req.agent,
+        req.input,
+        req.use_memory,
+        req.use_telemetry,
+        req.use_prompt_orchestrator,
+        req.skip_rewrite
+    )
+
+async def _run_agent_impl(agent_name: str, input_text: str, use_memory: bool = True,
+                          use_telemetry: bool = True, use_prompt_orchestrator: bool = True,
+                          skip_rewrite: bool = False) -> Dict[str, Any]:
+    """Shared body of /run, called with already-validated fields so /prompt skips building a RunRequest"""
+    if agent_name not in agent_map:
+        raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' not found")
     
-    agent = agent_map[req.agent]
+    agent = agent_map[agent_name]
     
     # Initialize memory if requested
     memory = None
-    if req.use_memory:
-        memory = AgentMemory(req.agent)
+    if use_memory:
+        memory = AgentMemory(agent_name)
     
     try:
         # Use prompt orchestrator if enabled
-        final_input = req.input
+        final_input = input_text
         orchestrator_result = None
         
-        if req.use_prompt_orchestrator:
+        if use_prompt_orchestrator and not skip_rewrite:
             try:
-                orchestrator_result = await call_prompt_orchestrator(req.input)
+                orchestrator_result = await call_prompt_orchestrator(input_text)
                 if orchestrator_result.get("rewritten_prompt"):
                     final_input = orchestrator_result["rewritten_prompt"]
-                    print(f"🔄 Prompt rewritten by orchestrator (confidence: {orchestrator_result.get('confidence', 0):.2f})")
+                    logger.debug("Prompt rewritten by orchestrator (confidence: %.2f)", orchestrator_result.get("confidence", 0))
             except Exception as e:
-                print(f"⚠️ Prompt orchestrator failed, using original prompt: {e}")
+                logger.warning("Prompt orchestrator failed, using original prompt: %s", e)
         
         # Use dispatcher for proper agent execution
-        output = await dispatcher.dispatch(req.agent, final_input)
+        output = await dispatcher.dispatch(agent_name, final_input)
         
-        # Log to memory if enabled
-        if memory:
-            memory.append(req.input, output)
-        
-        # Log telemetry if enabled
-        if req.use_telemetry:
-            telemetry_logger.log_event(
-                agent=req.agent,
-                input_text=req.input,
+        # Log telemetry if enabled; the background flusher records it
+        if use_telemetry:
+            queue_telemetry(
+                agent=agent_name,
+                input_text=input_text,
                 output_text=output
             )
         
+        # Log to memory if enabled, off the event loop
+        if memory:
+            await asyncio.get_running_loop().run_in_executor(
+                None, memory.append, input_text, output
+            )
+        
         result = {
-            "agent": req.agent,
+            "agent": agent_name,
             "output": output,
             "success": True,
-            "memory_enabled": req.use_memory,
-            "telemetry_enabled": req.use_telemetry,
-            "prompt_orchestrator_used": req.use_prompt_orchestrator
+            "memory_enabled": use_memory,
+            "telemetry_enabled": use_telemetry,
+            "prompt_orchestrator_used": use_prompt_orchestrator and not skip_rewrite
         }
         
         # Include orchestrator metadata if used
@@ -220,10 +441,10 @@ async def run_agent(req: RunRequest):
         
     except Exception as e:
         # Log error
-        if req.use_telemetry:
-            telemetry_logger.log_event(
-                agent=req.agent,
-                input_text=req.input,
+        if use_telemetry:
+            queue_telemetry(
+                agent=agent_name,
+                input_text=input_text,
                 output_text=f"Error: {str(e)}",
                 fallback="error_handling"
             )
@@ -242,7 +463,7 @@ async def run_auto(req: RunRequest):
         # Step 2: Select the best agent for the rewritten prompt
         selected_agent = orchestrator.select_agent(rewritten_prompt)
         
-        print(f"🎯 Auto-selected agent: {selected_agent} for prompt: {req.input[:50]}...")
+        logger.debug("Auto-selected agent: %s for prompt: %.50s...", selected_agent, req.input)
         
         # Step 3: Dispatch to the selected agent
         output = await dispatcher.dispatch(selected_agent, rewritten_prompt)
@@ -270,30 +491,31 @@ async def handle_prompt(req: PromptRequest):
         agent_recommendation = None
         final_agent = req.agent_preference or "evaluator"
         
-        if req.use_prompt_orchestrator:
+        # An explicit preference wins regardless, so only ask for a
+        # recommendation when routing is actually needed
+        if req.use_prompt_orchestrator and not req.agent_preference:
             try:
                 agent_recommendation = await get_agent_recommendation(req.input)
                 recommended_agent = agent_recommendation.get("recommended_agent")
                 
-                # Use recommendation if agent exists and no preference specified
-                if not req.agent_preference and recommended_agent in agent_map:
+                # Use recommendation if agent exists
+                if recommended_agent in agent_map:
                     final_agent = recommended_agent
-                    print(f"🎯 Auto-selected agent: {final_agent} (confidence: {agent_recommendation.get('confidence', 0):.2f})")
+                    logger.debug("Auto-selected agent: %s (confidence: %.2f)", final_agent, agent_recommendation.get("confidence", 0))
                     
             except Exception as e:
-                print(f"⚠️ Agent recommendation failed: {e}")
+                logger.warning("Agent recommendation failed: %s", e)
         
-        # Create RunRequest and execute
-        run_request = RunRequest(
-            agent=final_agent,
-            input=req.input,
-            use_memory=req.use_memory,
-            use_telemetry=req.use_telemetry,
-            use_prompt_orchestrator=req.use_prompt_orchestrator
+        # Execute with the already-validated request fields
+        result = await _run_agent_impl(
+            final_agent,
+            req.input,
+            req.use_memory,
+            req.use_telemetry,
+            req.use_prompt_orchestrator,
+            req.skip_rewrite
         )
         
-        result = await run_agent(run_request)
-        
         # Add auto-selection metadata
         if agent_recommendation:
             result["auto_selection"] = {
@@ -312,16 +534,16 @@ async def handle_prompt(req: PromptRequest):
 async def run_parallel_agents(req: ParallelRunRequest):
     """Run multiple agents in parallel"""
     # Validate agents
-    invalid_agents = [agent for agent in req.agents if agent not in agent_map]
+    invalid_agents = set(req.agents).difference(agent_map)
     if invalid_agents:
         raise HTTPException(
             status_code=404, 
-            detail=f"Agents not found: {invalid_agents}"
+            detail=f"Agents not found: {sorted(invalid_agents)}"
         )
     
     try:
         # Run parallel execution
-        result = await orchestrator.run_parallel(req.input, req.agents)
+        result = await orchestrator.run_parallel(req.input, req.agents, req.dispatch_strategy)
         
         return {
             "input": req.input,
@@ -333,32 +555,38 @@ async def run_parallel_agents(req: ParallelRunRequest):
             "agent_count": result.get("agent_count")
         }
         
+    except AgentCapacityError as e:
+        raise HTTPException(status_code=429, detail=f"Agent capacity exceeded: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Parallel execution failed: {str(e)}")
 
 @app.get("/agents")
-async def list_agents():
+async def list_agents(request: Request):
     """List all available agents with their capabilities"""
-    agents_info = {}
-    
-    for agent_name, agent in agent_map.items():
-        manifest_info = agent_manifest.get("agents", {}).get(agent_name, {})
-        
-        agents_info[agent_name] = {
-            "role": manifest_info.get("role", "Unknown"),
-            "capabilities": manifest_info.get("capabilities", []),
-            "confidence_threshold": manifest_info.get("confidence_threshold", 0.8),
-            "memory_enabled": manifest_info.get("memory_enabled", True),
-            "telemetry_enabled": manifest_info.get("telemetry_enabled", True),
-            "type": type(agent).__name__,
-            "available": True
-        }
-    
-    return {
-        "agents": agents_info,
-        "total_agents": len(agent_map),
-        "system_capabilities": agent_manifest.get("system_capabilities", {})
-    }
+    headers = {"ETag": _AGENTS_ETAG, "Cache-Control": f"max-age={AGENT_LIST_CACHE_TTL}"}
+    if request.headers.get("if-none-match") == _AGENTS_ETAG:
+        return Response(status_code=304, headers=headers)
+    return Response(content=_AGENTS_CACHED_JSON, media_type="application/json", headers=headers)
+
+@app.post("/agents/reload")
+async def reload_agents_listing():
+    """Rebuild the cached agents listing after the agent map changes"""
+    _refresh_agents_listing()
+    return {"message": "Agents listing rebuilt", "etag": _AGENTS_ETAG, "total_agents": len(agent_map)}
+
+# Static pieces of the /status body; the runtime values are spliced in
+# between them by concatenation, so manifest text is never used as a format string
+_STATUS_PREFIX = b'{"system":{"version":"15.0.0","status":"active","agents_available":'
+_STATUS_AGENTS = b',"telemetry_enabled":true,"memory_enabled":true},"agents":'
+_STATUS_TELEMETRY = b',"telemetry":'
+_STATUS_SUFFIX = (
+    b',"manifest":'
+    + _dumps({
+        "version": agent_manifest.get("system_info", {}).get("version", "unknown"),
+        "capabilities": agent_manifest.get("system_capabilities", {})
+    })
+    + b'}'
+)
 
 @app.get("/status")
 async def system_status():
@@ -369,21 +597,13 @@ async def system_status():
     # Get telemetry stats
     telemetry_stats = telemetry_logger.get_session_stats()
     
-    return {
-        "system": {
-            "version": "15.0.0",
-            "status": "active",
-            "agents_available": len(agent_map),
-            "telemetry_enabled": True,
-            "memory_enabled": True
-        },
-        "agents": agent_status,
-        "telemetry": telemetry_stats,
-        "manifest": {
-            "version": agent_manifest.get("system_info", {}).get("version", "unknown"),
-            "capabilities": agent_manifest.get("system_capabilities", {})
-        }
-    }
+    content = b"".join((
+        _STATUS_PREFIX, b"%d" % len(agent_map),
+        _STATUS_AGENTS, _dumps(agent_status),
+        _STATUS_TELEMETRY, _dumps(telemetry_stats),
+        _STATUS_SUFFIX
+    ))
+    return Response(content=content, media_type="application/json")
 
 @app.get("/memory/{agent_name}")
 async def get_agent_memory(agent_name: str, limit: int = 10):
@@ -416,18 +636,68 @@ async def get_telemetry_data():
             "total_events": stats.get("total_events", 0),
             "agent_usage": stats.get("agent_usage", {}),
             "fallback_rate": stats.get("fallback_rate", 0),
-            "avg_confidence": stats.get("avg_confidence", 0)
+            "avg_confidence": stats.get("avg_confidence", 0),
+            "queued_events": app.state.telemetry_q.qsize(),
+            "dropped_events": app.state.telemetry_dropped
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get telemetry: {str(e)}")
 
+# Streamed exports are flushed to the client in chunks of roughly this size
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+def _iter_session_json(header: Dict[str, Any], events: Iterator[Dict[str, Any]]) -> Iterator[bytes]:
+    """Encode a telemetry session as JSON one event at a time"""
+    # Reopen the header object so the event array can be appended to it
+    yield _dumps(header)[:-1] + b',"events":['
+    chunk = bytearray()
+    for i, event in enumerate(events):
+        if i:
+            chunk += b","
+        chunk += _dumps(event)
+        if len(chunk) >= _STREAM_CHUNK_BYTES:
+            yield bytes(chunk)
+            chunk.clear()
+    chunk += b"]}"
+    yield bytes(chunk)
+
+def _tee_to_file(chunks: Iterator[bytes], path: str) -> Iterator[bytes]:
+    """
+    Yield chunks unchanged while writing them to path
+    
+    Each export writes its own temporary file next to path and moves it into
+    place only once every chunk went out, so concurrent exports can't
+    interleave and an aborted stream never leaves a truncated export.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                yield chunk
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Includes GeneratorExit when the client disconnects mid-stream
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
 @app.post("/telemetry/export")
 async def export_telemetry(format: str = "json"):
     """Export telemetry data"""
     try:
         if format == "json":
-            data = telemetry_logger.save()
-            return data
+            # The session file is written from the same chunks as they stream,
+            # so neither side waits on a full in-memory dump
+            return StreamingResponse(
+                _tee_to_file(
+                    _iter_session_json(telemetry_logger.session_header(), telemetry_logger.iter_events()),
+                    telemetry_logger.path
+                ),
+                media_type="application/json"
+            )
         elif format == "csv":
             csv_path = f"telemetry_export_{telemetry_logger.session_id}.csv"
             telemetry_logger.export_to_csv(csv_path)
@@ -446,6 +716,23 @@ async def clear_telemetry():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Clear failed: {str(e)}")
 
+@app.delete("/cache")
+async def clear_orchestrator_cache():
+    """Clear cached agent recommendations"""
+    cleared = len(_route_cache)
+    _route_cache.clear()
+    return {"message": "Orchestrator cache cleared", "entries_cleared": cleared}
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # Each worker process imports the app itself, so agents, telemetry and the
+    # lifespan resources are per-process; uvicorn needs the import string for that
+    workers = int(os.environ.get("FUSION_WORKERS", "1"))
+    uvicorn.run(
+        "fusion_api:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        workers=workers
+    ) 
\ No newline at end of file
@@ -21,6 +21,24 @@ app = typer.Typer(
 # Configuration
 FUSION_API_URL = "http://localhost:8000"
 PROMPT_ORCHESTRATOR_URL = "http://localhost:8001"
+API_NOT_RUNNING = "Fusion API is not running. Please start it with: uvicorn fusion_api:app --reload"
+
+# One pooled client per CLI process, closed by _run once the command finishes
+_CLIENT = httpx.AsyncClient(
+    base_url=FUSION_API_URL,
+    timeout=60.0,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+)
+
+def _run(command):
+    """Run a command coroutine, then close the shared HTTP client"""
+    async def main():
+        try:
+            return await command
+        finally:
+            await _CLIENT.aclose()
+    
+    return asyncio.run(main())
 
 def print_status(message: str, emoji: str = "🚀"):
     """Print formatted status message"""
@@ -37,30 +55,19 @@ def print_success(message: str):
 async def check_api_health():
     """Check if Fusion API is running"""
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{FUSION_API_URL}/")
-            return response.status_code == 200
+        response = await _CLIENT.get("/", timeout=5.0)
+        return response.status_code == 200
     except:
         return False
 
 async def check_orchestrator_health():
     """Check if Prompt Orchestrator is running"""
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{PROMPT_ORCHESTRATOR_URL}/health")
-            return response.status_code == 200
+        response = await _CLIENT.get(f"{PROMPT_ORCHESTRATOR_URL}/health", timeout=5.0)
+        return response.status_code == 200
     except:
         return False
 
-def read_file_safely(file_path: str) -> Optional[str]:
-    """Safely read file content"""
-    try:
-        with open(file_path, 'r') as f:
-            return f.read()
-    except Exception as e:
-        print_error(f"Could not read file {file_path}: {e}")
-        return None
-
 @app.command()
 def prompt(
     text: str = typer.Argument(..., help="Your prompt text"),
@@ -82,29 +89,13 @@ def prompt(
         fusion prompt "Review this interface" --images ui.png,wireframe.png
         fusion prompt "Analyze this voice memo" --voice memo.wav
     """
-    asyncio.run(_handle_prompt(text, agent, voice, images, memory, telemetry, orchestrator, raw, verbose))
+    _run(_handle_prompt(text, agent, voice, images, memory, telemetry, orchestrator, raw, verbose))
 
 async def _handle_prompt(text: str, agent: Optional[str], voice: Optional[str], 
                         images: Optional[str], memory: bool, telemetry: bool, 
                         orchestrator: bool, raw: bool, verbose: bool):
     """Handle prompt command asynchronously"""
     
-    if verbose:
-        print_status("Checking Fusion API status...")
-    
-    # Check API health
-    api_healthy = await check_api_health()
-    if not api_healthy:
-        print_error("Fusion API is not running. Please start it with: uvicorn fusion_api:app --reload")
-        sys.exit(1)
-    
-    # Check orchestrator health if needed
-    if orchestrator:
-        orchestrator_healthy = await check_orchestrator_health()
-        if not orchestrator_healthy:
-            print_error("Prompt Orchestrator is not running. Starting in no-orchestrator mode...")
-            orchestrator = False
-    
     # Prepare request data
     request_data = {
         "input": text,
@@ -117,12 +108,14 @@ async def _handle_prompt(text: str, agent: Optional[str], voice: Optional[str],
         request_data["agent_preference"] = agent
     
     # Handle file attachments (placeholder for multipart support)
+    # Only paths are sent, so a stat is enough to validate attachments
     if voice:
-        voice_content = read_file_safely(voice)
-        if voice_content:
+        if Path(voice).exists():
             request_data["voice_attachment"] = voice
             if verbose:
                 print_status(f"Attached voice file: {voice}")
+        else:
+            print_error(f"Voice file not found: {voice}")
     
     if images:
         image_list = [img.strip() for img in images.split(",")]
@@ -145,52 +138,54 @@ async def _handle_prompt(text: str, agent: Optional[str], voice: Optional[str],
     
     # Send request to Fusion API
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            endpoint = "/prompt"  # Universal prompt endpoint
-            response = await client.post(f"{FUSION_API_URL}{endpoint}", json=request_data)
+        endpoint = "/prompt"  # Universal prompt endpoint
+        response = await _CLIENT.post(endpoint, json=request_data)
+        
+        if response.status_code == 200:
+            result = response.json()
             
-            if response.status_code == 200:
-                result = response.json()
+            if raw:
+                # Output raw JSON
+                print(json.dumps(result, indent=2))
+            else:
+                # Formatted output
+                print_success("Fusion Response:")
+                print()
                 
-                if raw:
-                    # Output raw JSON
-                    print(json.dumps(result, indent=2))
+                # Show agent selection info
+                if "auto_selection" in result:
+                    auto_info = result["auto_selection"]
+                    print(f"🎯 Agent: {result['agent']} (auto-selected, confidence: {auto_info.get('confidence', 0):.2f})")
+                    if verbose and auto_info.get("reasoning"):
+                        print(f"💭 Reasoning: {auto_info['reasoning']}")
                 else:
-                    # Formatted output
-                    print_success("Fusion Response:")
-                    print()
-                    
-                    # Show agent selection info
-                    if "auto_selection" in result:
-                        auto_info = result["auto_selection"]
-                        print(f"🎯 Agent: {result['agent']} (auto-selected, confidence: {auto_info.get('confidence', 0):.2f})")
-                        if verbose and auto_info.get("reasoning"):
-                            print(f"💭 Reasoning: {auto_info['reasoning']}")
-                    else:
-                        print(f"🎯 Agent: {result['agent']}")
-                    
-                    # Show orchestrator info if used
-                    if "orchestrator_metadata" in result and verbose:
-                        meta = result["orchestrator_metadata"]
-                        print(f"🔄 Orchestrator: {meta.get('pattern_type', 'unknown')} pattern (confidence: {meta.get('confidence', 0):.2f})")
-                    
-                    print()
-                    print("📄 Output:")
-                    print("-" * 60)
-                    print(result["output"])
-                    print("-" * 60)
-                    
-                    if verbose:
-                        print()
-                        print(f"⚡ Memory: {'enabled' if result.get('memory_enabled') else 'disabled'}")
-                        print(f"📊 Telemetry: {'enabled' if result.get('telemetry_enabled') else 'disabled'}")
-                        print(f"🔄 Orchestrator: {'used' if result.get('prompt_orchestrator_used') else 'bypassed'}")
-            else:
-                print_error(f"API request failed with status {response.status_code}")
-                if verbose:
-                    print(f"Response: {response.text}")
-                sys.exit(1)
+                    print(f"🎯 Agent: {result['agent']}")
+                
+                # Show orchestrator info if used
+                if "orchestrator_metadata" in result and verbose:
+                    meta = result["orchestrator_metadata"]
+                    print(f"🔄 Orchestrator: {meta.get('pattern_type', 'unknown')} pattern (confidence: {meta.get('confidence', 0):.2f})")
+                
+                print()
+                print("📄 Output:")
+                print("-" * 60)
+                print(result["output"])
+                print("-" * 60)
                 
+                if verbose:
+                    print()
+                    print(f"⚡ Memory: {'enabled' if result.get('memory_enabled') else 'disabled'}")
+                    print(f"📊 Telemetry: {'enabled' if result.get('telemetry_enabled') else 'disabled'}")
+                    print(f"🔄 Orchestrator: {'used' if result.get('prompt_orchestrator_used') else 'bypassed'}")
+        else:
+            print_error(f"API request failed with status {response.status_code}")
+            if verbose:
+                print(f"Response: {response.text}")
+            sys.exit(1)
+            
+    except httpx.ConnectError:
+        print_error(API_NOT_RUNNING)
+        sys.exit(1)
     except httpx.TimeoutException:
         print_error("Request timed out. The agent might be processing a complex request.")
         sys.exit(1)
@@ -201,41 +196,40 @@ async def _handle_prompt(text: str, agent: Optional[str], voice: Optional[str],
 @app.command()
 def agents():
     """List all available agents"""
-    asyncio.run(_list_agents())
+    _run(_list_agents())
 
 async def _list_agents():
     """List available agents asynchronously"""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(f"{FUSION_API_URL}/agents")
+        response = await _CLIENT.get("/agents", timeout=10.0)
+        
+        if response.status_code == 200:
+            data = response.json()
+            agents_info = data.get("agents", {})
             
-            if response.status_code == 200:
-                data = response.json()
-                agents_info = data.get("agents", {})
+            print_success(f"Available Agents ({data.get('total_agents', 0)}):")
+            print()
+            
+            for agent_name, info in agents_info.items():
+                status = "🟢" if info.get("available") else "🔴"
+                role = info.get("role", "Unknown")
+                capabilities = len(info.get("capabilities", []))
                 
-                print_success(f"Available Agents ({data.get('total_agents', 0)}):")
+                print(f"{status} {agent_name}")
+                print(f"   Role: {role}")
+                print(f"   Capabilities: {capabilities}")
                 print()
                 
-                for agent_name, info in agents_info.items():
-                    status = "🟢" if info.get("available") else "🔴"
-                    role = info.get("role", "Unknown")
-                    capabilities = len(info.get("capabilities", []))
-                    
-                    print(f"{status} {agent_name}")
-                    print(f"   Role: {role}")
-                    print(f"   Capabilities: {capabilities}")
-                    print()
-                    
-            else:
-                print_error(f"Failed to get agents: {response.status_code}")
-                
+        else:
+            print_error(f"Failed to get agents: {response.status_code}")
+            
     except Exception as e:
         print_error(f"Failed to get agents: {e}")
 
 @app.command()
 def status():
     """Check system status"""
-    asyncio.run(_check_status())
+    _run(_check_status())
 
 async def _check_status():
     """Check system status asynchronously"""
@@ -254,21 +248,20 @@ async def _check_status():
     # Get detailed status if API is running
     if api_healthy:
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{FUSION_API_URL}/status")
+            response = await _CLIENT.get("/status", timeout=10.0)
+            
+            if response.status_code == 200:
+                data = response.json()
+                system_info = data.get("system", {})
+                agents_info = data.get("agents", {})
+                
+                print()
+                print_success("System Details:")
+                print(f"Version: {system_info.get('version', 'unknown')}")
+                print(f"Agents Available: {system_info.get('agents_available', 0)}")
+                print(f"Memory Enabled: {system_info.get('memory_enabled', False)}")
+                print(f"Telemetry Enabled: {system_info.get('telemetry_enabled', False)}")
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    system_info = data.get("system", {})
-                    agents_info = data.get("agents", {})
-                    
-                    print()
-                    print_success("System Details:")
-                    print(f"Version: {system_info.get('version', 'unknown')}")
-                    print(f"Agents Available: {system_info.get('agents_available', 0)}")
-                    print(f"Memory Enabled: {system_info.get('memory_enabled', False)}")
-                    print(f"Telemetry Enabled: {system_info.get('telemetry_enabled', False)}")
-                    
         except Exception as e:
             print_error(f"Could not get detailed status: {e}")
 
@@ -288,7 +281,7 @@ def run(
         fusion run vp_design "Design a mobile app interface"
         fusion run evaluator "Critique this design approach" --orchestrator
     """
-    asyncio.run(_run_agent(agent, text, memory, telemetry, orchestrator, raw))
+    _run(_run_agent(agent, text, memory, telemetry, orchestrator, raw))
 
 async def _run_agent(agent: str, text: str, memory: bool, telemetry: bool, orchestrator: bool, raw: bool):
     """Run specific agent asynchronously"""
@@ -302,23 +295,25 @@ async def _run_agent(agent: str, text: str, memory: bool, telemetry: bool, orche
     }
     
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(f"{FUSION_API_URL}/run", json=request_data)
+        response = await _CLIENT.post("/run", json=request_data)
+        
+        if response.status_code == 200:
+            result = response.json()
             
-            if response.status_code == 200:
-                result = response.json()
-                
-                if raw:
-                    print(json.dumps(result, indent=2))
-                else:
-                    print_success(f"Agent '{agent}' Response:")
-                    print()
-                    print(result["output"])
-                    
+            if raw:
+                print(json.dumps(result, indent=2))
             else:
-                print_error(f"Agent execution failed: {response.status_code}")
-                print(response.text)
+                print_success(f"Agent '{agent}' Response:")
+                print()
+                print(result["output"])
                 
+        else:
+            print_error(f"Agent execution failed: {response.status_code}")
+            print(response.text)
+            
+    except httpx.ConnectError:
+        print_error(API_NOT_RUNNING)
+        sys.exit(1)
     except Exception as e:
         print_error(f"Agent execution failed: {e}")
 
@@ -5,6 +5,11 @@ import os
 from typing import List, Dict, Any
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
 class AgentMemory:
     def __init__(self, agent_name: str, memory_dir="fusion_memory"):
         self.agent_name = agent_name
@@ -15,8 +20,12 @@ class AgentMemory:
     def _load(self):
         """Load existing memory or create new memory file"""
         if os.path.exists(self.memory_path):
-            with open(self.memory_path, "r") as f:
-                self.data = json.load(f)
+            if orjson is not None:
+                with open(self.memory_path, "rb") as f:
+                    self.data = orjson.loads(f.read())
+            else:
+                with open(self.memory_path, "r") as f:
+                    self.data = json.load(f)
         else:
             self.data = {
                 "agent_name": self.agent_name,
@@ -1,5 +1,5 @@
 # fusion_core/orchestration/__init__.py
 
-from .multi_agent_orchestrator import MultiAgentOrchestrator
+from .multi_agent_orchestrator import MultiAgentOrchestrator, AgentCapacityError
 
-__all__ = ["MultiAgentOrchestrator"] 
\ No newline at end of file
+__all__ = ["MultiAgentOrchestrator", "AgentCapacityError"] 
\ No newline at end of file
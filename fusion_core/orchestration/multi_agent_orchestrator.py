@@ -1,22 +1,52 @@
 # fusion_core/orchestration/multi_agent_orchestrator.py
 
 import asyncio
+import inspect
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor
 import json
 
+DISPATCH_STRATEGIES = ("batch", "bounded", "pipeline")
+
+class AgentCapacityError(Exception):
+    """Raised when an agent cannot get an execution slot in time"""
+
 class MultiAgentOrchestrator:
     def __init__(self, agents: Dict[str, Any], evaluator_agent=None, 
-                 telemetry_logger=None, memory_manager=None):
+                 telemetry_logger=None, memory_manager=None,
+                 max_concurrency: Optional[int] = None, max_waiting: int = 256,
+                 slot_timeout: float = 10.0,
+                 pipeline_stage_sizes: Tuple[int, int, int] = (4, 8, 4)):
         self.agents = agents
         self.evaluator = evaluator_agent
         self.telemetry = telemetry_logger
         self.memory = memory_manager
         self.executor = ThreadPoolExecutor(max_workers=10)
+        
+        # Optional cap on agents executing at once across all parallel runs.
+        # The semaphore is created on first use so it binds to the serving loop.
+        self.max_concurrency = max_concurrency
+        self.max_waiting = max_waiting
+        self.slot_timeout = slot_timeout
+        self._agent_slots = None
+        self._waiting = 0
+        
+        # Worker counts for the setup, run and evaluation stages of the pipeline strategy
+        self.pipeline_stage_sizes = pipeline_stage_sizes
+
+    async def run_parallel(self, input_text: str, agent_names: List[str] = None,
+                           dispatch_strategy: str = "batch") -> Dict[str, Any]:
+        """Run multiple agents in parallel and aggregate results
 
-    async def run_parallel(self, input_text: str, agent_names: List[str] = None) -> Dict[str, Any]:
-        """Run multiple agents in parallel and aggregate results"""
+        dispatch_strategy selects how agents are scheduled:
+        "batch" runs every agent at once and evaluates when all have finished,
+        "bounded" does the same but caps agents in flight at the run-stage size,
+        "pipeline" streams agents through setup, run and evaluation stages.
+        """
+        if dispatch_strategy not in DISPATCH_STRATEGIES:
+            raise ValueError(f"Unknown dispatch strategy: {dispatch_strategy}")
+        
         start_time = time.time()
         
         # Use specified agents or all available agents
@@ -27,26 +57,60 @@ class MultiAgentOrchestrator:
         if not available_agents:
             return {"error": "No agents available", "results": []}
         
+        if dispatch_strategy == "pipeline":
+            processed_results, evaluations = await self._run_pipeline(available_agents, input_text)
+        else:
+            limit = self.pipeline_stage_sizes[1] if dispatch_strategy == "bounded" else None
+            processed_results, evaluations = await self._run_batch(available_agents, input_text, limit)
+        
+        # Sort by evaluation score if available
+        if evaluations:
+            processed_results.sort(key=lambda x: x.get("evaluation", {}).get("score", 0), reverse=True)
+        
+        # Log parallel execution
+        if self.telemetry:
+            self.telemetry.log_parallel_execution(processed_results)
+        
+        execution_time = time.time() - start_time
+        
+        return {
+            "top_result": processed_results[0] if processed_results else None,
+            "all_results": processed_results,
+            "evaluations": evaluations,
+            "execution_time": execution_time,
+            "agent_count": len(available_agents)
+        }
+
+    async def _run_batch(self, available_agents: Dict[str, Any], input_text: str,
+                         limit: Optional[int] = None):
+        """Run all agents, then evaluate the successful results"""
+        run_limit = asyncio.Semaphore(limit) if limit else None
+        
+        async def run_one(agent_name, agent):
+            if run_limit is None:
+                return await self._run_agent_bounded(agent_name, agent, input_text)
+            async with run_limit:
+                return await self._run_agent_bounded(agent_name, agent, input_text)
+        
         # Run agents in parallel
         tasks = []
         for agent_name, agent in available_agents.items():
-            task = self._run_agent_async(agent_name, agent, input_text)
+            task = run_one(agent_name, agent)
             tasks.append(task)
         
         # Wait for all agents to complete
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
+        # Surface capacity failures so callers can shed load
+        for result in results:
+            if isinstance(result, AgentCapacityError):
+                raise result
+        
         # Process results and handle exceptions
         processed_results = []
-        for i, result in enumerate(results):
-            agent_name = list(available_agents.keys())[i]
+        for agent_name, result in zip(available_agents, results):
             if isinstance(result, Exception):
-                processed_results.append({
-                    "agent": agent_name,
-                    "output": f"Error: {str(result)}",
-                    "success": False,
-                    "execution_time": 0
-                })
+                processed_results.append(self._error_result(agent_name, result))
             else:
                 processed_results.append(result)
         
@@ -59,42 +123,180 @@ class MultiAgentOrchestrator:
                     evaluations.append(eval_result)
                     result["evaluation"] = eval_result
         
-        # Sort by evaluation score if available
-        if evaluations:
-            processed_results.sort(key=lambda x: x.get("evaluation", {}).get("score", 0), reverse=True)
+        return processed_results, evaluations
+
+    async def _run_pipeline(self, available_agents: Dict[str, Any], input_text: str):
+        """Stream agents through bounded setup, run and evaluation stages
+
+        Each agent is evaluated as soon as its own run finishes, so a slow
+        evaluator overlaps with agents that are still running.
+        """
+        setup_size, run_size, eval_size = self.pipeline_stage_sizes
+        setup_queue = asyncio.Queue(maxsize=setup_size)
+        run_queue = asyncio.Queue(maxsize=run_size)
+        eval_queue = asyncio.Queue(maxsize=eval_size)
+        results = {}
+        capacity_errors = []
         
-        # Log parallel execution
-        if self.telemetry:
-            self.telemetry.log_parallel_execution(processed_results)
+        async def setup_worker():
+            while True:
+                agent_name, agent = await setup_queue.get()
+                try:
+                    enhanced_input = self._prepare_input(agent_name, input_text)
+                except Exception as e:
+                    results[agent_name] = self._error_result(agent_name, e)
+                else:
+                    await run_queue.put((agent_name, agent, enhanced_input))
+                finally:
+                    setup_queue.task_done()
         
-        execution_time = time.time() - start_time
+        async def run_worker():
+            while True:
+                agent_name, agent, enhanced_input = await run_queue.get()
+                try:
+                    result = await self._run_agent_bounded(agent_name, agent, input_text, enhanced_input)
+                except AgentCapacityError as e:
+                    capacity_errors.append(e)
+                except Exception as e:
+                    results[agent_name] = self._error_result(agent_name, e)
+                else:
+                    results[agent_name] = result
+                    if self.evaluator and result["success"]:
+                        await eval_queue.put(result)
+                finally:
+                    run_queue.task_done()
+        
+        async def eval_worker():
+            while True:
+                result = await eval_queue.get()
+                try:
+                    result["evaluation"] = await self._evaluate_result(result, input_text)
+                finally:
+                    eval_queue.task_done()
+        
+        workers = [asyncio.ensure_future(setup_worker()) for _ in range(setup_size)]
+        workers += [asyncio.ensure_future(run_worker()) for _ in range(run_size)]
+        workers += [asyncio.ensure_future(eval_worker()) for _ in range(eval_size)]
+        try:
+            for item in available_agents.items():
+                await setup_queue.put(item)
+            # Each stage only hands work downstream before marking it done,
+            # so joining the queues in order waits for the whole pipeline
+            await setup_queue.join()
+            await run_queue.join()
+            await eval_queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        
+        if capacity_errors:
+            raise capacity_errors[0]
         
+        # Report results in request order, matching the batch strategy
+        processed_results = [results[name] for name in available_agents if name in results]
+        evaluations = [result["evaluation"] for result in processed_results if "evaluation" in result]
+        return processed_results, evaluations
+
+    async def _call(self, entry_point: Any, *args: Any) -> Any:
+        """Await coroutine functions directly; run sync ones on the orchestrator's thread pool"""
+        if inspect.iscoroutinefunction(entry_point):
+            return await entry_point(*args)
+        
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.executor, entry_point, *args)
+        # Callable objects with an async __call__ hand back an awaitable
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def _error_result(self, agent_name: str, error: Exception) -> Dict[str, Any]:
+        """Result entry for an agent that raised before producing output"""
         return {
-            "top_result": processed_results[0] if processed_results else None,
-            "all_results": processed_results,
-            "evaluations": evaluations,
-            "execution_time": execution_time,
-            "agent_count": len(available_agents)
+            "agent": agent_name,
+            "output": f"Error: {str(error)}",
+            "success": False,
+            "execution_time": 0
         }
 
-    async def _run_agent_async(self, agent_name: str, agent: Any, input_text: str) -> Dict[str, Any]:
+    def _prepare_input(self, agent_name: str, input_text: str) -> str:
+        """Prefix the input with the agent's memory context when available"""
+        context = ""
+        if self.memory:
+            context = self.memory.get_context(agent_name)
+        return f"{context}\n\nCurrent Request: {input_text}" if context else input_text
+
+    async def _run_agent_bounded(self, agent_name: str, agent: Any, input_text: str,
+                                 enhanced_input: Optional[str] = None) -> Dict[str, Any]:
+        """Run a single agent once an execution slot is free"""
+        if not self.max_concurrency:
+            return await self._run_agent_async(agent_name, agent, input_text, enhanced_input)
+        
+        if self._agent_slots is None:
+            self._agent_slots = asyncio.Semaphore(self.max_concurrency)
+        
+        if self._waiting >= self.max_waiting:
+            raise AgentCapacityError(f"Too many agents waiting to run ({self._waiting})")
+        
+        self._waiting += 1
+        try:
+            acquired = await self._acquire_slot()
+        finally:
+            self._waiting -= 1
+        if not acquired:
+            raise AgentCapacityError(
+                f"No execution slot for agent '{agent_name}' within {self.slot_timeout}s"
+            )
+        
+        try:
+            return await self._run_agent_async(agent_name, agent, input_text, enhanced_input)
+        finally:
+            self._agent_slots.release()
+
+    async def _acquire_slot(self) -> bool:
+        """Take an execution slot, returning False if none frees up within slot_timeout"""
+        if hasattr(asyncio, "timeout"):
+            try:
+                async with asyncio.timeout(self.slot_timeout):
+                    await self._agent_slots.acquire()
+            except TimeoutError:
+                return False
+            return True
+        
+        # Before 3.11 wait_for can take the slot and still raise, so wait on the
+        # acquire as a task and give the slot back if it lands after we gave up
+        def release_if_acquired(task):
+            if not task.cancelled() and task.exception() is None:
+                self._agent_slots.release()
+        
+        acquire = asyncio.ensure_future(self._agent_slots.acquire())
+        try:
+            done, _ = await asyncio.wait({acquire}, timeout=self.slot_timeout)
+        except BaseException:
+            acquire.cancel()
+            acquire.add_done_callback(release_if_acquired)
+            raise
+        if not done:
+            acquire.cancel()
+            acquire.add_done_callback(release_if_acquired)
+            return False
+        return True
+
+    async def _run_agent_async(self, agent_name: str, agent: Any, input_text: str,
+                               enhanced_input: Optional[str] = None) -> Dict[str, Any]:
         """Run a single agent asynchronously"""
         start_time = time.time()
         
         try:
-            # Get agent context from memory if available
-            context = ""
-            if self.memory:
-                context = self.memory.get_context(agent_name)
-            
-            # Prepare input with context
-            enhanced_input = f"{context}\n\nCurrent Request: {input_text}" if context else input_text
+            # Prepare input with memory context unless a pipeline stage already did
+            if enhanced_input is None:
+                enhanced_input = self._prepare_input(agent_name, input_text)
             
             # Run agent
             if hasattr(agent, 'run'):
-                output = await agent.run(enhanced_input)
+                output = await self._call(agent.run, enhanced_input)
             elif hasattr(agent, '__call__'):
-                output = await agent(enhanced_input)
+                output = await self._call(agent, enhanced_input)
             else:
                 output = str(agent)
             
@@ -169,9 +371,9 @@ class MultiAgentOrchestrator:
             """
             
             if hasattr(self.evaluator, 'run'):
-                eval_output = await self.evaluator.run(evaluation_prompt)
+                eval_output = await self._call(self.evaluator.run, evaluation_prompt)
             else:
-                eval_output = str(self.evaluator(evaluation_prompt))
+                eval_output = str(await self._call(self.evaluator, evaluation_prompt))
             
             # Parse evaluation (simple heuristic)
             score = 0.5  # Default score
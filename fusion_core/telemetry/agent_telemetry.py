@@ -4,7 +4,8 @@ import time
 import json
 import os
 from uuid import uuid4
-from typing import Dict, Any, List, Optional
+from itertools import islice
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
 
 class AgentTelemetryLogger:
@@ -19,10 +20,30 @@ class AgentTelemetryLogger:
                   tokens_used: int = 0, fallback: Optional[str] = None, 
                   confidence: float = 0.0, execution_time: float = 0.0):
         """Log a single agent execution event"""
-        elapsed = round(time.time() - self.start, 2)
+        event = self._make_event(agent, input_text, output_text, tokens_used,
+                                 fallback, confidence, execution_time)
+        self.events.append(event)
+        return event
+
+    def log_batch(self, events: List[Dict[str, Any]]) -> int:
+        """Log several agent execution events at once
+
+        Each entry takes the same keyword arguments as log_event, plus an
+        optional "logged_at" epoch time recorded when the event was queued.
+        """
+        self.events.extend(self._make_event(**event) for event in events)
+        return len(events)
+
+    def _make_event(self, agent: str, input_text: str, output_text: str,
+                    tokens_used: int = 0, fallback: Optional[str] = None,
+                    confidence: float = 0.0, execution_time: float = 0.0,
+                    logged_at: Optional[float] = None) -> Dict[str, Any]:
+        """Build an agent execution event record"""
+        logged_at = logged_at or time.time()
+        elapsed = round(logged_at - self.start, 2)
         
-        event = {
-            "timestamp": datetime.now().isoformat(),
+        return {
+            "timestamp": datetime.fromtimestamp(logged_at).isoformat(),
             "agent": agent,
             "input": input_text[:200] + "..." if len(input_text) > 200 else input_text,
             "output": output_text[:200] + "..." if len(output_text) > 200 else output_text,
@@ -33,9 +54,6 @@ class AgentTelemetryLogger:
             "elapsed": elapsed,
             "session_elapsed": elapsed
         }
-        
-        self.events.append(event)
-        return event
 
     def log_parallel_execution(self, agent_results: List[Dict[str, Any]]):
         """Log results from parallel agent execution"""
@@ -71,16 +89,24 @@ class AgentTelemetryLogger:
         self.events.append(eval_event)
         return eval_event
 
-    def save(self):
-        """Save telemetry data to disk"""
-        session_data = {
+    def iter_events(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the events logged so far without copying the list"""
+        return islice(self.events, len(self.events))
+
+    def session_header(self) -> Dict[str, Any]:
+        """Session metadata and summary, without the event list"""
+        return {
             "session_id": self.session_id,
             "start_time": datetime.fromtimestamp(self.start).isoformat(),
             "end_time": datetime.now().isoformat(),
             "total_events": len(self.events),
-            "events": self.events,
             "summary": self._generate_summary()
         }
+
+    def save(self):
+        """Save telemetry data to disk"""
+        session_data = self.session_header()
+        session_data["events"] = self.events
         
         with open(self.path, "w") as f:
             json.dump(session_data, f, indent=2)
@@ -5,8 +5,10 @@ Allow external devs to register agents/tools without editing core files.
 """
 
 import os
+import sys
 import json
 import importlib
+import importlib.util
 import inspect
 from typing import Dict, List, Any, Optional, Type
 from pathlib import Path
@@ -112,13 +114,34 @@ class PluginRegistry:
             print(f"❌ Error registering config {config_name}: {e}")
             return False
     
-    def discover_plugins(self) -> Dict[str, Any]:
+    def _import_plugin(self, py_file: Path, plugins_dir: Path):
+        """Import a plugin file; the registry's own directory is imported as the plugins package"""
+        if plugins_dir.resolve() == self.plugins_dir.resolve():
+            return importlib.import_module(f"plugins.{py_file.stem}")
+        
+        spec = importlib.util.spec_from_file_location(f"{plugins_dir.name}.{py_file.stem}", py_file)
+        module = importlib.util.module_from_spec(spec)
+        # Register before executing, as the import system does, so dataclasses,
+        # pickling and self-imports inside the plugin can find it
+        sys.modules[spec.name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(spec.name, None)
+            raise
+        return module
+    
+    def discover_plugins(self, plugins_dir: Optional[str] = None) -> Dict[str, Any]:
         """
         Automatically discover and load plugins from the plugins directory.
         
+        Args:
+            plugins_dir: Directory to scan instead of the registry's own
+        
         Returns:
             Dictionary with discovery results
         """
+        plugins_dir = self.plugins_dir if plugins_dir is None else Path(plugins_dir)
         discovery_results = {
             "agents_found": 0,
             "tools_found": 0,
@@ -126,19 +149,26 @@ class PluginRegistry:
             "errors": []
         }
         
-        if not self.plugins_dir.exists():
-            print(f"⚠️ Plugins directory {self.plugins_dir} does not exist")
+        # Scan directly and treat a missing directory as the rare case,
+        # rather than paying a stat() on every discovery
+        try:
+            with os.scandir(plugins_dir) as entries:
+                py_files = [
+                    Path(entry.path) for entry in entries
+                    if entry.name.endswith(".py") and not entry.name.startswith(".")
+                ]
+        except FileNotFoundError:
+            print(f"⚠️ Plugins directory {plugins_dir} does not exist")
             return discovery_results
         
         # Discover Python files in plugins directory
-        for py_file in self.plugins_dir.glob("*.py"):
+        for py_file in py_files:
             if py_file.name.startswith("__"):
                 continue
                 
             try:
                 # Import the plugin module
-                module_name = f"plugins.{py_file.stem}"
-                module = importlib.import_module(module_name)
+                module = self._import_plugin(py_file, plugins_dir)
                 
                 # Look for agent classes
                 for name, obj in inspect.getmembers(module):
@@ -245,9 +275,9 @@ def register_config(config_name: str, config_data: Dict[str, Any]) -> bool:
     """Register configuration data with the global registry."""
     return plugin_registry.register_config(config_name, config_data)
 
-def discover_plugins() -> Dict[str, Any]:
+def discover_plugins(plugins_dir: Optional[str] = None) -> Dict[str, Any]:
     """Discover and load all plugins."""
-    return plugin_registry.discover_plugins()
+    return plugin_registry.discover_plugins(plugins_dir)
 
 # Example plugin agent
 class ExamplePluginAgent:
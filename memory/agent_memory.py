@@ -11,6 +11,11 @@ import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
 class AgentMemory:
     """
     Agent Memory System - Fusion v14
@@ -46,6 +51,9 @@ class AgentMemory:
     async def read_memory(self) -> Dict[str, Any]:
         """Read agent memory from JSON file"""
         try:
+            if orjson is not None:
+                with open(self.memory_file, 'rb') as f:
+                    return orjson.loads(f.read())
             with open(self.memory_file, 'r') as f:
                 return json.load(f)
         except Exception as e:
@@ -3,9 +3,11 @@
 Minimal Fusion API without external dependencies
 Uses only built-in Python modules
 """
+import inspect
 import json
+import re
 import http.server
-import socketserver
+from http.server import ThreadingHTTPServer
 import urllib.parse
 from typing import Dict, Any
 import threading
@@ -18,140 +20,214 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from core.agent_loader import load_agents
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; this server runs on the stdlib alone
+    orjson = None
+
+def _json_bytes(obj) -> bytes:
+    """Encode obj as compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+def _json_loads(body: bytes):
+    """Parse JSON straight from the request bytes, without decoding to str first"""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+# Largest /run request body accepted; anything bigger is refused before it is read
+MAX_BODY_BYTES = 1024 * 1024
+
+# Routing keywords per agent, in priority order: when keywords from several
+# groups appear in the input, the earliest group wins
+AGENT_KEYWORDS = (
+    # Design & Creative patterns
+    ('creative_director', ('design', 'ui', 'ux', 'interface', 'mobile app', 'website', 'prototype', 'wireframe', 'visual')),
+    # Strategy & Planning patterns
+    ('strategy_pilot', ('strategy', 'plan', 'roadmap', 'goal', 'objective', 'vision', 'direction')),
+    # Content & Writing patterns
+    ('content_designer', ('content', 'copy', 'writing', 'text', 'message', 'communication', 'narrative')),
+    # Product & Business patterns
+    ('product_navigator', ('product', 'feature', 'requirement', 'business', 'user story', 'backlog')),
+    # Technical & Development patterns
+    ('design_technologist', ('code', 'technical', 'development', 'api', 'database', 'architecture')),
+    # Research & Analysis patterns
+    ('market_analyst', ('research', 'analyze', 'data', 'insights', 'trends', 'market')),
+    # Evaluation & Review patterns
+    ('evaluator', ('evaluate', 'review', 'feedback', 'critique', 'assess', 'quality')),
+)
+
+def _dedupe_keywords(groups):
+    """
+    Drop keywords that can never change the routing decision
+    
+    A keyword is redundant when it repeats, or contains, a keyword from the
+    same or a higher-priority group: wherever it matches, that other keyword
+    matches too (e.g. 'requirement' contains 'ui'), so leaving it out of the
+    pattern only saves the regex engine work.
+    """
+    indexed = [
+        (priority, position, keyword)
+        for priority, (_, keywords) in enumerate(groups)
+        for position, keyword in enumerate(keywords)
+    ]
+    deduped = []
+    for priority, (agent_name, keywords) in enumerate(groups):
+        kept = tuple(
+            keyword for position, keyword in enumerate(keywords)
+            if not any(
+                other in keyword and (other != keyword or (other_priority, other_position) < (priority, position))
+                for other_priority, other_position, other in indexed
+                if other_priority <= priority and (other_priority, other_position) != (priority, position)
+            )
+        )
+        if kept:
+            deduped.append((agent_name, kept))
+    return tuple(deduped)
+
+# One pattern for every keyword group. The zero-width lookahead reports a
+# match at each position where any keyword starts, so overlapping keywords
+# are all seen; at a given position the earliest group wins the alternation
+AGENT_PATTERN = re.compile(
+    '(?=' + '|'.join(
+        f"(?P<{agent_name}>{'|'.join(map(re.escape, keywords))})"
+        for agent_name, keywords in _dedupe_keywords(AGENT_KEYWORDS)
+    ) + ')',
+    re.IGNORECASE
+)
+
+# Group name -> priority, used to pick the best match across positions
+_AGENT_PRIORITY = {agent_name: priority for priority, (agent_name, _) in enumerate(AGENT_KEYWORDS)}
+
+def _simplified_response(agent_name):
+    """Build the placeholder responder used when an agent can't be run synchronously"""
+    # Everything but the user input is fixed per agent, so bake it into the
+    # template once and leave a single format() per request
+    template = (
+        f"[{agent_name}] Processing: {{ui}}\n\n"
+        f"Agent: {agent_name.replace('_', ' ').title()}\n"
+        f"Response: I'll help you with '{{ui}}'. This is a simplified response from {agent_name}."
+    )
+    return lambda user_input: template.format(ui=user_input)
+
+def _build_agent_dispatch(agents):
+    """
+    Classify each agent once and map its name to a (run, fallback) pair
+    
+    Agents without run() echo the input, async run() methods can't be awaited
+    from the request thread and get the simplified response, and sync run()
+    methods are called directly. fallback is the simplified response, used
+    when run raises.
+    """
+    dispatch = {}
+    for agent_name, agent in agents.items():
+        fallback = _simplified_response(agent_name)
+        
+        if not hasattr(agent, 'run'):
+            def run(user_input, agent_name=agent_name):
+                return f"Agent {agent_name} processed: {user_input}"
+        elif inspect.iscoroutinefunction(agent.run):
+            run = fallback
+        else:
+            def run(user_input, agent_run=agent.run):
+                result = agent_run(user_input)
+                return result.get("output", str(result))
+        
+        dispatch[agent_name] = (run, fallback)
+    return dispatch
+
+def _build_get_bodies(agents):
+    """Encode the GET endpoint responses for the loaded agents"""
+    return {
+        '/': _json_bytes({
+            "message": "Fusion v15 API (Minimal)",
+            "endpoints": [
+                "/status - System status",
+                "/agents - List all agents", 
+                "/run - Run agent (POST)"
+            ]
+        }),
+        '/agents': _json_bytes(list(agents.keys())),
+        '/status': _json_bytes({
+            "status": "running",
+            "agents_loaded": len(agents),
+            "version": "v15-minimal"
+        })
+    }
+
 class FusionHandler(http.server.BaseHTTPRequestHandler):
-    def __init__(self, *args, **kwargs):
-        # Load agents once when handler is created
-        self.agents = load_agents()
-        super().__init__(*args, **kwargs)
+    # A handler is created per request, so agents are loaded once per
+    # process by start_server and shared through the class
+    agents: Dict[str, Any] = {}
+    agent_dispatch: Dict[str, Any] = {}
+    # GET responses never change once the agents are loaded, so they are
+    # encoded once by start_server and written out as-is
+    get_bodies: Dict[str, bytes] = {}
     
     def select_best_agent(self, user_input):
         """Smart agent selection based on input content"""
-        input_lower = user_input.lower()
-        
-        # Design & Creative patterns
-        if any(word in input_lower for word in ['design', 'ui', 'ux', 'interface', 'mobile app', 'website', 'prototype', 'wireframe', 'visual']):
-            return 'creative_director'
-        
-        # Strategy & Planning patterns  
-        elif any(word in input_lower for word in ['strategy', 'plan', 'roadmap', 'goal', 'objective', 'vision', 'direction']):
-            return 'strategy_pilot'
-        
-        # Content & Writing patterns
-        elif any(word in input_lower for word in ['content', 'copy', 'writing', 'text', 'message', 'communication', 'narrative']):
-            return 'content_designer'
-        
-        # Product & Business patterns
-        elif any(word in input_lower for word in ['product', 'feature', 'requirement', 'business', 'user story', 'backlog']):
-            return 'product_navigator'
-        
-        # Technical & Development patterns
-        elif any(word in input_lower for word in ['code', 'technical', 'development', 'api', 'database', 'architecture']):
-            return 'design_technologist'
-        
-        # Research & Analysis patterns
-        elif any(word in input_lower for word in ['research', 'analyze', 'data', 'insights', 'trends', 'market']):
-            return 'market_analyst'
-        
-        # Evaluation & Review patterns
-        elif any(word in input_lower for word in ['evaluate', 'review', 'feedback', 'critique', 'assess', 'quality']):
-            return 'evaluator'
+        best = None
+        for match in AGENT_PATTERN.finditer(user_input):
+            agent_name = match.lastgroup
+            if best is None or _AGENT_PRIORITY[agent_name] < _AGENT_PRIORITY[best]:
+                best = agent_name
+                # The first group can't be beaten
+                if _AGENT_PRIORITY[best] == 0:
+                    break
         
         # Default to evaluator for general queries
-        else:
-            return 'evaluator'
+        return best or 'evaluator'
     
     def do_GET(self):
         """Handle GET requests"""
-        if self.path == '/':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            response = {
-                "message": "Fusion v15 API (Minimal)",
-                "endpoints": [
-                    "/status - System status",
-                    "/agents - List all agents", 
-                    "/run - Run agent (POST)"
-                ]
-            }
-            self.wfile.write(json.dumps(response, indent=2).encode())
-            
-        elif self.path == '/agents':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            agent_list = list(self.agents.keys())
-            self.wfile.write(json.dumps(agent_list).encode())
-            
-        elif self.path == '/status':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            status = {
-                "status": "running",
-                "agents_loaded": len(self.agents),
-                "version": "v15-minimal"
-            }
-            self.wfile.write(json.dumps(status).encode())
-        else:
+        body = self.get_bodies.get(self.path)
+        if body is None:
             self.send_404()
+        else:
+            self._send_body(200, body)
     
     def do_POST(self):
         """Handle POST requests"""
         if self.path == '/run':
             try:
                 # Read request body
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
+                content_length = int(self.headers.get('Content-Length', '0'))
+                if content_length > MAX_BODY_BYTES:
+                    self.send_error(413, "Request body too large")
+                    return
+                if content_length < 0:
+                    self.send_error(400, "Invalid Content-Length")
+                    return
                 
                 # Parse JSON
-                data = json.loads(post_data.decode('utf-8'))
+                data = _json_loads(self.rfile.read(content_length))
                 user_input = data.get('input', 'Hello')
                 
                 # Smart agent routing based on input content
                 agent_name = self.select_best_agent(user_input)
                 
                 # Get agent
-                agent = self.agents.get(agent_name)
-                if not agent:
+                entry = self.agent_dispatch.get(agent_name)
+                if not entry:
                     self.send_error(400, f"Agent '{agent_name}' not found")
                     return
                 
-                # Run agent (simplified - handle both sync and async)
+                run, fallback = entry
                 try:
-                    if hasattr(agent, 'run'):
-                        result = agent.run(user_input)
-                        # If it's a coroutine, we can't await it in this sync context
-                        # So provide a simple response instead
-                        if hasattr(result, '__await__'):
-                            output = f"[{agent_name}] Processing: {user_input}\n\nAgent: {agent_name.replace('_', ' ').title()}\nResponse: I'll help you with '{user_input}'. This is a simplified response from {agent_name}."
-                        else:
-                            output = result.get("output", str(result))
-                    else:
-                        output = f"Agent {agent_name} processed: {user_input}"
-                    
+                    output = run(user_input)
                 except Exception as e:
-                    output = f"[{agent_name}] Processing: {user_input}\n\nAgent: {agent_name.replace('_', ' ').title()}\nResponse: I'll help you with '{user_input}'. This is a simplified response from {agent_name}."
+                    output = fallback(user_input)
                 
                 # Send response
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                
                 response = {
                     "agent": agent_name,
                     "input": user_input,
                     "output": output,
                     "success": True
                 }
-                self.wfile.write(json.dumps(response).encode())
+                self._send_json(200, response)
                 
             except Exception as e:
                 self.send_error(500, f"Server error: {str(e)}")
@@ -166,12 +242,21 @@ class FusionHandler(http.server.BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
     
-    def send_404(self):
-        self.send_response(404)
+    def _send_json(self, status, obj):
+        """Send obj as a JSON response with CORS and Content-Length headers"""
+        self._send_body(status, _json_bytes(obj))
+    
+    def _send_body(self, status, body):
+        """Send already-encoded JSON bytes"""
+        self.send_response(status)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
-        self.wfile.write(json.dumps({"error": "Not found"}).encode())
+        self.wfile.write(body)
+    
+    def send_404(self):
+        self._send_json(404, {"error": "Not found"})
     
     def log_message(self, format, *args):
         """Custom logging"""
@@ -179,7 +264,11 @@ class FusionHandler(http.server.BaseHTTPRequestHandler):
 
 def start_server(port=8000):
     """Start the minimal API server"""
-    with socketserver.TCPServer(("", port), FusionHandler) as httpd:
+    FusionHandler.agents = load_agents()
+    FusionHandler.agent_dispatch = _build_agent_dispatch(FusionHandler.agents)
+    FusionHandler.get_bodies = _build_get_bodies(FusionHandler.agents)
+    
+    with ThreadingHTTPServer(("", port), FusionHandler) as httpd:
         print(f"🚀 Minimal Fusion API running on http://localhost:{port}")
         print(f"📝 Available endpoints:")
         print(f"   GET  / - API info")
@@ -5,20 +5,49 @@ Dedicated microservice for prompt analysis, rewriting, and agent routing
 Extracted from PromptMaster agent for scalable architecture
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
 import asyncio
 import time
 import json
 import os
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from types import MappingProxyType
 
 # Import PromptMaster functionality
 from agents.prompt_master_agent import PromptMasterAgent
+from core.ttl_cache import TTLCache
 
-app = FastAPI(title="Fusion Prompt Orchestrator", version="15.0.0")
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+class OrchestratorJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when available"""
+    
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm PromptMaster's pattern caches so the first request in each worker doesn't pay for them"""
+    _load_patterns()
+    prompt_master._analyze_prompt_pattern("warmup")
+    yield
+
+app = FastAPI(
+    title="Fusion Prompt Orchestrator",
+    version="15.0.0",
+    lifespan=lifespan,
+    default_response_class=OrchestratorJSONResponse
+)
 
 # Add CORS middleware
 app.add_middleware(
@@ -29,10 +58,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# PromptMaster's work is synchronous CPU and file I/O, so endpoints that only
+# call into it are plain `def` handlers: Starlette runs them in its threadpool
+# without building a coroutine per request. Use `async def` only for endpoints
+# that actually await something.
+
 # Pydantic models
 class PromptRequest(BaseModel):
     prompt: str
-    context: Optional[Dict[str, Any]] = {}
+    context: Optional[Dict[str, Any]] = Field(default_factory=dict)
     agent_preference: Optional[str] = None
     use_memory: bool = True
     use_fallback: bool = True
@@ -55,12 +89,62 @@ class AgentRouteRequest(BaseModel):
 class AgentRouteResponse(BaseModel):
     recommended_agent: str
     confidence: float
-    alternatives: List[str]
+    alternatives: Tuple[str, ...]
     reasoning: str
 
+# Fallback routing used by /route when confidence is below the threshold
+_PATTERN_DEFAULTS = MappingProxyType({
+    "design_focused": "vp_design",
+    "strategy_focused": "strategy_pilot",
+    "technical_focused": "design_technologist",
+    "content_focused": "content_designer",
+    "general": "evaluator"
+})
+_DEFAULT_ALTS = ("vp_design", "creative_director")
+
+# Context handed to PromptMaster is read-only so one request can't leak state into another
+_EMPTY_CONTEXT = MappingProxyType({})
+_HIGH_CONFIDENCE_REASON = "High confidence routing to specialized agents."
+_LOW_CONFIDENCE_REASON = "Low confidence, using fallback routing."
+
 # Initialize PromptMaster
 prompt_master = PromptMasterAgent()
 
+# /route and /analyze results for repeated prompts are served from a bounded,
+# short-lived cache. Keys include the mtime of every file the result depends
+# on, so edits on disk retire old entries without waiting for the TTL.
+# /rewrite is never cached: each call records itself in PromptMaster's memory
+# and its rewrite is derived from that memory
+_CACHE = TTLCache(maxsize=4096, ttl=600)
+
+# Parsed pattern registry, reused until the file's mtime changes
+_patterns_cache = {"mtime": None, "data": None}
+
+# /health report, recomputed at most once a second however often it is polled
+HEALTH_CACHE_TTL = 1.0
+_health = {"checked_at": 0.0, "data": None}
+
+def _mtime(path: str) -> Optional[int]:
+    """Modification time of path, or None if it doesn't exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def _patterns_mtime() -> Optional[int]:
+    """Modification time of the pattern registry, or None if it doesn't exist"""
+    return _mtime(prompt_master.pattern_file)
+
+def _load_patterns() -> Dict[str, Any]:
+    """Return the pattern registry, re-reading it only when the file changes"""
+    mtime = _patterns_mtime()
+    if mtime is None:
+        return prompt_master._read_patterns()
+    if _patterns_cache["mtime"] != mtime:
+        _patterns_cache["data"] = prompt_master._read_patterns()
+        _patterns_cache["mtime"] = mtime
+    return _patterns_cache["data"]
+
 @app.get("/")
 async def root():
     """Root endpoint with service information"""
@@ -77,7 +161,7 @@ async def root():
     }
 
 @app.post("/rewrite", response_model=PromptResponse)
-async def rewrite_prompt(req: PromptRequest):
+def rewrite_prompt(req: PromptRequest):
     """
     Analyze and rewrite a prompt using PromptMaster logic
     
@@ -91,7 +175,7 @@ async def rewrite_prompt(req: PromptRequest):
         start_time = time.time()
         
         # Use PromptMaster to analyze and rewrite
-        result = await prompt_master.run_async(req.prompt, req.context)
+        result = prompt_master.run_sync(req.prompt, MappingProxyType(req.context) if req.context else _EMPTY_CONTEXT)
         
         if "error" in result:
             raise HTTPException(status_code=500, detail=result["error"])
@@ -99,7 +183,9 @@ async def rewrite_prompt(req: PromptRequest):
         # Extract data from PromptMaster response
         shared_state = result.get("shared_state", {})
         
-        response = PromptResponse(
+        # Fields come from PromptMaster, not the client, and FastAPI validates
+        # the response_model on the way out, so skip validating them twice
+        response = PromptResponse.model_construct(
             original_prompt=req.prompt,
             rewritten_prompt=shared_state.get("rewritten_prompt", req.prompt),
             pattern_type=shared_state.get("pattern_type", "general"),
@@ -117,7 +203,7 @@ async def rewrite_prompt(req: PromptRequest):
         raise HTTPException(status_code=500, detail=f"Prompt rewriting failed: {str(e)}")
 
 @app.post("/route", response_model=AgentRouteResponse)
-async def route_agent(req: AgentRouteRequest):
+def route_agent(req: AgentRouteRequest):
     """
     Get agent routing recommendations based on prompt analysis
     
@@ -128,8 +214,14 @@ async def route_agent(req: AgentRouteRequest):
         AgentRouteResponse with recommended agent and alternatives
     """
     try:
+        # Pattern analysis only sees the lowercased prompt
+        key = ("route", req.prompt.lower(), req.confidence_threshold, _patterns_mtime())
+        cached = _CACHE.get(key)
+        if cached is not None:
+            return cached
+        
         # Use PromptMaster for pattern analysis
-        result = await prompt_master.run_async(req.prompt, {})
+        result = prompt_master.run_sync(req.prompt, _EMPTY_CONTEXT)
         
         if "error" in result:
             raise HTTPException(status_code=500, detail=result["error"])
@@ -142,40 +234,33 @@ async def route_agent(req: AgentRouteRequest):
         # Determine primary recommendation
         if suggested_agents and confidence >= req.confidence_threshold:
             recommended_agent = suggested_agents[0]
-            alternatives = suggested_agents[1:3]  # Next 2 alternatives
+            alternatives = tuple(suggested_agents[1:3])  # Next 2 alternatives
         else:
             # Default routing based on pattern
-            pattern_defaults = {
-                "design_focused": "vp_design",
-                "strategy_focused": "strategy_pilot", 
-                "technical_focused": "design_technologist",
-                "content_focused": "content_designer",
-                "general": "evaluator"
-            }
-            recommended_agent = pattern_defaults.get(pattern_type, "evaluator")
-            alternatives = ["vp_design", "creative_director"]
+            recommended_agent = _PATTERN_DEFAULTS.get(pattern_type, "evaluator")
+            alternatives = _DEFAULT_ALTS
         
-        reasoning = f"Pattern '{pattern_type}' detected with {confidence:.2f} confidence. "
-        if confidence >= req.confidence_threshold:
-            reasoning += "High confidence routing to specialized agents."
-        else:
-            reasoning += "Low confidence, using fallback routing."
+        reasoning = f"Pattern '{pattern_type}' detected with {confidence:.2f} confidence. " + (
+            _HIGH_CONFIDENCE_REASON if confidence >= req.confidence_threshold else _LOW_CONFIDENCE_REASON
+        )
         
-        return AgentRouteResponse(
+        response = AgentRouteResponse.model_construct(
             recommended_agent=recommended_agent,
             confidence=confidence,
             alternatives=alternatives,
             reasoning=reasoning
         )
+        _CACHE[key] = response
+        return response
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Agent routing failed: {str(e)}")
 
 @app.get("/patterns")
-async def get_patterns():
+def get_patterns():
     """Get available prompt patterns and their configurations"""
     try:
-        patterns = await prompt_master._read_patterns()
+        patterns = _load_patterns()
         return {
             "patterns": patterns.get("patterns", {}),
             "total_patterns": len(patterns.get("patterns", {}))
@@ -184,39 +269,55 @@ async def get_patterns():
         raise HTTPException(status_code=500, detail=f"Failed to get patterns: {str(e)}")
 
 @app.get("/health")
-async def health_check():
-    """Service health check"""
+def health_check():
+    """Service health check, served from a cache refreshed every HEALTH_CACHE_TTL seconds"""
+    now = time.monotonic()
+    if _health["data"] is not None and now - _health["checked_at"] < HEALTH_CACHE_TTL:
+        return _health["data"]
+    
     try:
-        # Test PromptMaster functionality
-        test_result = await prompt_master._analyze_prompt_pattern("test prompt")
+        # PromptMaster is ready once its files are configured; the pattern
+        # scan itself is warmed at startup, so it isn't re-run per ping
+        memory_file, pattern_file = prompt_master.memory_file, prompt_master.pattern_file
         
-        return {
+        report = {
             "status": "healthy",
             "timestamp": datetime.now().isoformat(),
             "prompt_master_available": True,
             "memory_files_exist": {
-                "agent_memory": os.path.exists(prompt_master.memory_file),
-                "pattern_registry": os.path.exists(prompt_master.pattern_file)
+                "agent_memory": os.path.exists(memory_file),
+                "pattern_registry": os.path.exists(pattern_file)
             }
         }
     except Exception as e:
-        return {
+        report = {
             "status": "unhealthy",
             "error": str(e),
             "timestamp": datetime.now().isoformat()
         }
+    
+    _health["data"] = report
+    _health["checked_at"] = now
+    return report
 
 @app.post("/analyze")
-async def analyze_prompt(req: PromptRequest):
+def analyze_prompt(req: PromptRequest):
     """
     Lightweight prompt analysis without rewriting
     For quick pattern detection and agent suggestions
     """
     try:
-        pattern, confidence, suggested_agents = await prompt_master._analyze_prompt_pattern(req.prompt)
-        insights = await prompt_master._get_memory_insights(req.prompt)
+        cacheable = not req.context and req.use_memory
+        # Insights are read from PromptMaster's memory, so its mtime is part of the key
+        key = ("analyze", req.prompt.lower(), _patterns_mtime(), _mtime(prompt_master.memory_file))
+        cached = _CACHE.get(key) if cacheable else None
+        if cached is not None:
+            return cached
         
-        return {
+        pattern, confidence, suggested_agents = prompt_master._analyze_prompt_pattern(req.prompt)
+        insights = prompt_master._get_memory_insights(req.prompt)
+        
+        analysis = {
             "pattern": pattern,
             "confidence": confidence, 
             "suggested_agents": suggested_agents,
@@ -228,12 +329,16 @@ async def analyze_prompt(req: PromptRequest):
             "fallback_needed": confidence < 0.7
         }
         
+        if cacheable:
+            _CACHE[key] = analysis
+        return analysis
+        
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Prompt analysis failed: {str(e)}")
 
 # Configuration endpoint for updating patterns
 @app.post("/patterns/update")
-async def update_patterns(patterns: Dict[str, Any]):
+def update_patterns(patterns: Dict[str, Any]):
     """Update prompt patterns configuration"""
     try:
         # Validate pattern structure
@@ -244,6 +349,10 @@ async def update_patterns(patterns: Dict[str, Any]):
         with open(prompt_master.pattern_file, 'w') as f:
             json.dump(patterns, f, indent=2)
         
+        # Cached results were computed against the old patterns
+        _CACHE.clear()
+        _patterns_cache["mtime"] = None
+        
         return {
             "message": "Patterns updated successfully",
             "patterns_count": len(patterns.get("patterns", {}))